@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for the Luma scraper against a local replay server.
+
+City, search and event pages (see benchmark_fixtures/) are served from a
+local HTTP server with configurable latency, and the discovery and
+extraction paths of luma_sf_events_detailed.py run against it in each mode.
+
+The fixtures are hand-written templates modelled on the markup the scraper
+looks for (JSON-LD, __NEXT_DATA__ and plain host/description blocks), not
+recorded snapshots of lu.ma. Their structure and size are simpler than the
+real pages, so use the numbers to compare modes and revisions, not to
+predict production throughput; --page-kb pads pages to a more realistic
+size.
+Every mode runs in a fresh process so that its peak memory is measured on
+its own. Modes that need Chrome are skipped when no browser can be started.
+
+Reported per mode: events/sec, p50/p95 per-event latency, discovery time,
+and the peak RSS of the scraper process and of the largest browser process.
+
+Usage:
+    python luma_benchmark.py
+    python luma_benchmark.py --events 60 --latency 0.2 --jitter 0.05 --modes http,browser-script
+    python luma_benchmark.py --serve-only --port 8766
+    python luma_sf_events_detailed.py --keywords "AI" --base-url http://127.0.0.1:8766 --headless
+"""
+
+import os
+import sys
+import json
+import time
+import html
+import random
+import logging
+import argparse
+import resource
+import datetime
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from luma_sf_events_detailed import (
+    DriverPool, create_driver, set_base_url, RATE_LIMITER, search_for_events, find_event_links,
+    extract_event_with_pool, run_pipeline, DEFAULT_CITY, DEFAULT_MAX_SCROLLS,
+)
+from luma_http_fetch import create_http_session
+from luma_structured_data import ERROR_TITLE
+from luma_metrics import METRICS, RunMetrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_fixtures")
+
+# Scraper settings of each benchmark mode
+BENCHMARK_MODES = {
+    "http": {"fetch_mode": "http", "extraction_mode": "script", "lean": False},
+    "browser-dom": {"fetch_mode": "browser", "extraction_mode": "dom", "lean": False},
+    "browser-script": {"fetch_mode": "browser", "extraction_mode": "script", "lean": False},
+    "browser-lean": {"fetch_mode": "browser", "extraction_mode": "script", "lean": True},
+}
+
+# Event cards rendered with the search page; the rest load through "Load more"
+SEARCH_PAGE_SIZE = 20
+
+# Event cards shown on the city page
+CITY_PAGE_CARDS = 5
+
+EVENT_TOPICS = ["AI Builders Night", "Robotics Demo Day", "Climate Tech Mixer", "Founders Breakfast",
+                "Data Engineering Meetup", "Open Source AI Hack Night", "Design Systems Talks"]
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description='Benchmark the Luma scraper against a local replay server')
+
+    # Replay server parameters
+    parser.add_argument('--fixtures-dir', default=DEFAULT_FIXTURES_DIR, help='Directory with the fixture pages (default: benchmark_fixtures/)')
+    parser.add_argument('--host', default='127.0.0.1', help='Address of the replay server (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=0, help='Port of the replay server (default: any free port)')
+    parser.add_argument('--events', type=int, default=40, help='Number of events listed in the search results (default: 40)')
+    parser.add_argument('--latency', type=float, default=0.05, help='Seconds added to every response (default: 0.05)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Random extra latency of up to this many seconds (default: 0)')
+    parser.add_argument('--page-kb', type=int, default=100, help='Inline script padding per event page in KB, like the bundles of real pages (default: 100)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the latency jitter (default: 0)')
+    parser.add_argument('--serve-only', action='store_true', help='Only run the replay server, e.g. for manual runs with --base-url')
+
+    # Scraper parameters
+    parser.add_argument('--modes', default=",".join(BENCHMARK_MODES), help=f'Comma-separated modes to run (default: {",".join(BENCHMARK_MODES)})')
+    parser.add_argument('--keyword', default='AI', help='Keyword searched for during discovery (default: AI)')
+    parser.add_argument('--workers', type=int, default=4, help='Number of events processed at the same time (default: 4)')
+    parser.add_argument('--wait-time', type=int, default=5, help='Maximum wait time in seconds for page loading (default: 5)')
+    parser.add_argument('--max-scrolls', type=int, default=DEFAULT_MAX_SCROLLS, help=f'Maximum scroll steps during discovery (default: {DEFAULT_MAX_SCROLLS})')
+    parser.add_argument('--rate-limit', type=float, default=1000.0, help='Page loads per second allowed by the rate limiter (default: 1000, i.e. effectively off)')
+    parser.add_argument('--max-host-concurrency', type=int, default=32, help='Concurrent page loads allowed by the rate limiter (default: 32)')
+    parser.add_argument('--chromedriver-path', help='Path to chromedriver executable (optional)')
+
+    # Output parameters
+    parser.add_argument('--output', default='benchmark_results.json', help='JSON report path (default: benchmark_results.json)')
+    parser.add_argument('--verbose', action='store_true', help='Keep the scraper\'s info logging during the runs')
+
+    args = parser.parse_args()
+    args.modes = [mode.strip() for mode in args.modes.split(',') if mode.strip()]
+    unknown = [mode for mode in args.modes if mode not in BENCHMARK_MODES]
+    if unknown:
+        parser.error(f"unknown modes: {', '.join(unknown)} (choose from {', '.join(BENCHMARK_MODES)})")
+    if args.events < 1:
+        parser.error("--events must be at least 1")
+    return args
+
+class ReplayServer:
+    """
+    Local HTTP server serving the fixture Luma pages.
+
+    Serves ``/<city>`` from city.html, ``/search`` from search.html and
+    ``/e/evt-bench-NNNN`` from the templates in events/, used in turn so the
+    results mix JSON-LD, Next.js data and markup-only pages. Every response is
+    delayed by ``latency`` plus up to ``jitter`` seconds.
+    """
+
+    def __init__(self, fixtures_dir, events=40, latency=0.0, jitter=0.0, page_kb=0, host="127.0.0.1", port=0, seed=0):
+        """
+        Args:
+            fixtures_dir: Directory with city.html, search.html and events/*.html
+            events: Number of events listed in the search results
+            latency: Seconds added to every response
+            jitter: Random extra latency of up to this many seconds
+            page_kb: Inline script padding added to every event page, in KB
+            host: Address to listen on
+            port: Port to listen on; 0 picks a free port
+            seed: Seed for the latency jitter
+        """
+        self.events = events
+        self.latency = latency
+        self.jitter = jitter
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self.bytes_sent = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+        with open(os.path.join(fixtures_dir, "city.html"), encoding="utf-8") as f:
+            self._city_template = f.read()
+        with open(os.path.join(fixtures_dir, "search.html"), encoding="utf-8") as f:
+            self._search_template = f.read()
+        events_dir = os.path.join(fixtures_dir, "events")
+        self._event_templates = []
+        for name in sorted(os.listdir(events_dir)):
+            if name.endswith(".html"):
+                with open(os.path.join(events_dir, name), encoding="utf-8") as f:
+                    self._event_templates.append(f.read())
+        if not self._event_templates:
+            raise ValueError(f"No event page templates found in {events_dir}")
+
+        self._padding = ""
+        if page_kb > 0:
+            self._padding = f'<script>window.__LUMA_BUNDLE__ = "{"x" * (page_kb * 1024)}";</script>'
+
+    @property
+    def url(self):
+        """Base URL of the running server."""
+        return f"http://{self.host}:{self.port}"
+
+    def event_ids(self):
+        return [f"evt-bench-{number:04d}" for number in range(1, self.events + 1)]
+
+    def event_urls(self):
+        return [f"{self.url}/e/{event_id}" for event_id in self.event_ids()]
+
+    def _event_fields(self, number):
+        return {
+            "event_id": f"evt-bench-{number:04d}",
+            "title": f"{EVENT_TOPICS[(number - 1) % len(EVENT_TOPICS)]} #{number}",
+            "start_time": f"2026-05-{(number - 1) % 28 + 1:02d}T18:00:00-07:00",
+        }
+
+    def _event_cards(self, numbers):
+        cards = []
+        for number in numbers:
+            fields = self._event_fields(number)
+            cards.append(f'    <div class="event-card"><a href="/e/{fields["event_id"]}"><h3>{fields["title"]}</h3>'
+                         f'<span class="event-time">{fields["start_time"]}</span></a></div>')
+        return "\n".join(cards)
+
+    def render(self, path, query):
+        """
+        Render the page for a request path.
+
+        Args:
+            path: Request path
+            query: Parsed query string
+
+        Returns:
+            tuple: (HTTP status, HTML body)
+        """
+        segments = [segment for segment in path.split("/") if segment]
+        numbers = range(1, self.events + 1)
+
+        if segments == ["search"]:
+            # The same fixture results are served for every query
+            more = [{"id": fields["event_id"], "title": fields["title"], "start": fields["start_time"]}
+                    for fields in map(self._event_fields, numbers[SEARCH_PAGE_SIZE:])]
+            page = (self._search_template
+                    .replace("{{query}}", html.escape(query.get("q", [""])[0]))
+                    .replace("{{event_cards}}", self._event_cards(numbers[:SEARCH_PAGE_SIZE]))
+                    .replace("{{more_events}}", json.dumps(more))
+                    .replace("{{page_size}}", str(SEARCH_PAGE_SIZE)))
+            return 200, page
+
+        if len(segments) == 2 and segments[0] == "e" and segments[1] in self.event_ids():
+            number = int(segments[1].rsplit("-", 1)[1])
+            page = self._event_templates[(number - 1) % len(self._event_templates)]
+            for key, value in self._event_fields(number).items():
+                page = page.replace("{{" + key + "}}", value)
+            return 200, page.replace("{{padding}}", self._padding)
+
+        if len(segments) == 1 and segments[0] not in ("e", "search"):
+            page = (self._city_template
+                    .replace("{{city}}", html.escape(segments[0]))
+                    .replace("{{event_cards}}", self._event_cards(numbers[:CITY_PAGE_CARDS])))
+            return 200, page
+
+        return 404, "<!doctype html><html><head><title>Not found</title></head><body><h1>404</h1></body></html>"
+
+    def delay(self):
+        """Return the latency to inject into one response."""
+        with self._lock:
+            return self.latency + (self._random.uniform(0, self.jitter) if self.jitter > 0 else 0.0)
+
+    def record(self, size):
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += size
+
+    def start(self):
+        """Start serving in a background thread."""
+        self._server = ThreadingHTTPServer((self.host, self.port), ReplayRequestHandler)
+        self._server.daemon_threads = True
+        self._server.replay = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the server."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+class ReplayRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler serving the pages of a ReplayServer."""
+
+    def do_GET(self):
+        replay = self.server.replay
+        parsed = urlparse(self.path)
+        status, page = replay.render(parsed.path, parse_qs(parsed.query))
+        time.sleep(replay.delay())
+
+        body = page.encode("utf-8")
+        replay.record(len(body))
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # One line per request would drown the benchmark output
+        pass
+
+def _rss_mb(max_rss):
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(max_rss / divisor, 1)
+
+def _benchmark_mode(result, settings, pool, http_session, event_urls, options):
+    """Run discovery and extraction for one mode, filling in ``result``."""
+    wait_time = options["wait_time"]
+    workers = max(1, options["workers"])
+
+    # Discovery needs the browser; without one, the replay server's list is used
+    try:
+        start = time.monotonic()
+        driver = pool.acquire()
+        result["browser_start_seconds"] = round(time.monotonic() - start, 3)
+    except Exception as e:
+        if settings["fetch_mode"] == "browser":
+            result["skipped"] = f"browser unavailable: {getattr(e, 'msg', None) or str(e)}"
+            return
+        logger.error(f"Browser unavailable, benchmarking extraction only: {str(e)}")
+        result["discovery"] = {"skipped": "browser unavailable"}
+        links = list(event_urls)
+    else:
+        start = time.monotonic()
+        links = []
+        if search_for_events(driver, options["keyword"], wait_time, city=DEFAULT_CITY):
+            links = find_event_links(driver, max_events=len(event_urls), wait_time=wait_time,
+                                     extraction_mode=settings["extraction_mode"], max_scrolls=options["max_scrolls"])
+        result["discovery"] = {"seconds": round(time.monotonic() - start, 3), "links_found": len(links)}
+        pool.release(driver)
+        if not links:
+            result["skipped"] = "discovery found no event links"
+            return
+
+        if settings["fetch_mode"] == "browser":
+            # Start the other sessions up front so that extraction timing excludes Chrome startup
+            drivers = []
+            for _ in range(workers):
+                try:
+                    drivers.append(pool.acquire())
+                except Exception as e:
+                    logger.error(f"Could not start WebDriver session: {str(e)}")
+                    break
+            for driver in drivers:
+                pool.release(driver)
+
+    timings = RunMetrics()
+    errors = []
+
+    def extract(index, link):
+        with timings.span("event"):
+            return extract_event_with_pool(pool, link, wait_time, http_session=http_session,
+                                           extraction_mode=settings["extraction_mode"])
+
+    def write(event):
+        if event.get("title") == ERROR_TITLE:
+            errors.append(event["url"])
+
+    start = time.monotonic()
+    count = run_pipeline(links, extract, write, workers=workers)
+    elapsed = time.monotonic() - start
+
+    latency = timings.summary()["spans"].get("event", {})
+    result.update({
+        "events": count,
+        "errors": len(errors),
+        "seconds": round(elapsed, 3),
+        "events_per_second": round(count / elapsed, 2) if elapsed > 0 else None,
+        "latency_p50_seconds": latency.get("p50_seconds"),
+        "latency_p95_seconds": latency.get("p95_seconds"),
+        "latency_max_seconds": latency.get("max_seconds"),
+    })
+
+def run_mode(mode, base_url, event_urls, options):
+    """
+    Benchmark one mode; runs in its own process.
+
+    Args:
+        mode: Key of BENCHMARK_MODES
+        base_url: Base URL of the replay server
+        event_urls: Event URLs listed by the replay server
+        options: Benchmark arguments as a dict
+
+    Returns:
+        dict: Results of the mode
+    """
+    if not options["verbose"]:
+        logging.getLogger().setLevel(logging.ERROR)
+    settings = BENCHMARK_MODES[mode]
+    set_base_url(base_url)
+    RATE_LIMITER.configure(rate=options["rate_limit"], max_concurrency=options["max_host_concurrency"])
+    METRICS.reset()
+
+    driver_args = argparse.Namespace(headless=True, lean=settings["lean"],
+                                     chromedriver_path=options["chromedriver_path"], wait_time=options["wait_time"])
+    workers = max(1, options["workers"])
+    pool = DriverPool(lambda: create_driver(driver_args), size=workers)
+    http_session = create_http_session(pool_size=workers) if settings["fetch_mode"] == "http" else None
+
+    result = dict(mode=mode, **settings)
+    try:
+        _benchmark_mode(result, settings, pool, http_session, event_urls, options)
+    except Exception as e:
+        logger.error(f"Benchmark mode {mode} failed: {str(e)}")
+        result["error"] = str(e)
+    finally:
+        if http_session:
+            http_session.close()
+        # Quitting the sessions reaps chromedriver, so its peak shows up in RUSAGE_CHILDREN
+        pool.close()
+
+    result["peak_rss_mb"] = _rss_mb(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    if "browser_start_seconds" in result:
+        result["browser_peak_rss_mb"] = _rss_mb(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    result["phases"] = METRICS.summary()["spans"]
+    return result
+
+def print_report(results):
+    """Print one line per mode."""
+    print(f"\n{'Mode':<16}{'Events':>8}{'Errors':>8}{'Events/s':>10}{'p50 (s)':>9}{'p95 (s)':>9}"
+          f"{'Discovery (s)':>15}{'Peak RSS (MB)':>15}")
+    for result in results:
+        if "skipped" in result or "error" in result:
+            print(f"{result['mode']:<16}skipped: {result.get('skipped') or result.get('error')}")
+            continue
+        discovery = result.get("discovery", {}).get("seconds")
+        rss = f"{result['peak_rss_mb']}"
+        if "browser_peak_rss_mb" in result:
+            rss += f" + {result['browser_peak_rss_mb']}"
+        print(f"{result['mode']:<16}{result['events']:>8}{result['errors']:>8}{result['events_per_second']:>10}"
+              f"{result['latency_p50_seconds']:>9}{result['latency_p95_seconds']:>9}"
+              f"{discovery if discovery is not None else '-':>15}{rss:>15}")
+
+def main():
+    """Run the replay server and benchmark each requested mode."""
+    args = parse_arguments()
+    server = ReplayServer(args.fixtures_dir, events=args.events, latency=args.latency, jitter=args.jitter,
+                          page_kb=args.page_kb, host=args.host, port=args.port, seed=args.seed)
+    server.start()
+    logger.info(f"Replay server listening on {server.url} ({args.events} events, "
+                f"{args.latency:.3f}s latency, {args.jitter:.3f}s jitter)")
+
+    try:
+        if args.serve_only:
+            print(f"Replay server listening on {server.url}; press Ctrl+C to stop")
+            while True:
+                time.sleep(3600)
+
+        results = []
+        # A fresh interpreter per mode, so each peak RSS covers that mode only
+        context = multiprocessing.get_context("spawn")
+        for mode in args.modes:
+            logger.info(f"Benchmarking mode {mode}")
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                result = executor.submit(run_mode, mode, server.url, server.event_urls(), vars(args)).result()
+            results.append(result)
+
+        report = {
+            "generated_at": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+            "config": {key: value for key, value in vars(args).items() if key not in ("serve_only", "verbose")},
+            "server": {"requests": server.requests, "bytes_sent": server.bytes_sent},
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+        print_report(results)
+        print(f"\nReport saved to: {args.output}")
+        return 0
+    except KeyboardInterrupt:
+        logger.info("Benchmark interrupted")
+        return 1
+    finally:
+        server.stop()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate detection for Luma events with MinHash and LSH.
+
+Luma often lists the same meetup under several URLs. Every extracted event
+is fingerprinted with a MinHash signature over its title, host names and
+summary. The signature is split into bands, and each band is hashed into a
+bucket of a SQLite index that persists between runs. Candidates are only
+the events sharing at least one bucket, so a lookup does not scan the whole
+index; their estimated similarity decides whether the event is a
+near-duplicate.
+
+Each event belongs to a cluster, named after the first URL seen with that
+content. An event is a duplicate within a run when a similar event has
+already been kept in the same run. URLs that an earlier run already put
+into another event's cluster can be skipped before their detail page is
+fetched.
+
+Usage:
+    from luma_dedupe import NearDuplicateIndex
+    index = NearDuplicateIndex("luma_dedupe.sqlite", threshold=0.8)
+    for link in index.filter_links(event_links):
+        event = extract(link)
+        match = index.check(event)
+        if match and match["duplicate_of"]:
+            continue
+        write(event)
+    index.close()
+"""
+
+import re
+import time
+import random
+import hashlib
+import logging
+from array import array
+
+from luma_structured_data import PLACEHOLDER_VALUES, ERROR_TITLE
+from luma_sqlite_store import SqliteStore
+from luma_metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEDUPE_PATH = "luma_dedupe.sqlite"
+
+DEDUPE_MODES = ("off", "drop", "cluster")
+
+# Mersenne prime for the universal hash family of the MinHash permutations
+_MERSENNE_PRIME = (1 << 61) - 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS signatures (
+    url TEXT PRIMARY KEY,
+    cluster_id TEXT NOT NULL,
+    signature BLOB NOT NULL,
+    title TEXT,
+    seen_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS buckets (
+    band INTEGER NOT NULL,
+    bucket TEXT NOT NULL,
+    url TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS buckets_lookup ON buckets (band, bucket);
+CREATE INDEX IF NOT EXISTS buckets_url ON buckets (url);
+CREATE INDEX IF NOT EXISTS signatures_seen_at ON signatures (seen_at);
+"""
+
+def _words(text):
+    return re.findall(r"[a-z0-9]+", (text or "").lower())
+
+def event_features(record):
+    """
+    Build the feature set fingerprinted for an event.
+
+    Title words and word pairs, full host names and three-word summary
+    shingles, each tagged with its field so that e.g. a host name never
+    matches a title word.
+
+    Args:
+        record: Event details dict
+
+    Returns:
+        set: Feature strings; empty if the record has no usable text
+    """
+    features = set()
+
+    title = record.get("title")
+    if title and title not in PLACEHOLDER_VALUES:
+        words = _words(title)
+        features.update(f"t:{word}" for word in words)
+        features.update(f"t:{first} {second}" for first, second in zip(words, words[1:]))
+
+    for speaker in record.get("speakers") or []:
+        name = " ".join(_words(speaker.get("name") if isinstance(speaker, dict) else speaker))
+        if name:
+            features.add(f"h:{name}")
+
+    summary = record.get("summary")
+    if summary and summary not in PLACEHOLDER_VALUES:
+        words = _words(summary)
+        if len(words) < 3:
+            features.update(f"s:{word}" for word in words)
+        else:
+            features.update(f"s:{' '.join(words[i:i + 3])}" for i in range(len(words) - 2))
+
+    return features
+
+class MinHasher:
+    """MinHash signatures from ``num_perm`` seeded hash permutations."""
+
+    def __init__(self, num_perm=128, seed=1):
+        """
+        Args:
+            num_perm: Signature length
+            seed: Seed of the permutation coefficients; signatures are only
+                  comparable between hashers with the same seed and length
+        """
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._permutations = [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+                              for _ in range(num_perm)]
+
+    def signature(self, features):
+        """
+        Compute the MinHash signature of a feature set.
+
+        Args:
+            features: Non-empty iterable of feature strings
+
+        Returns:
+            array: ``num_perm`` unsigned 64-bit minimum hash values
+        """
+        hashes = [int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+                  for feature in features]
+        return array("Q", (min((a * value + b) % _MERSENNE_PRIME for value in hashes)
+                           for a, b in self._permutations))
+
+def estimated_similarity(first, second):
+    """Estimate the Jaccard similarity of two feature sets from their signatures."""
+    return sum(1 for a, b in zip(first, second) if a == b) / len(first)
+
+class NearDuplicateIndex(SqliteStore):
+    """
+    Persistent LSH index of event signatures.
+
+    With ``bands`` bands of ``num_perm / bands`` rows, pairs above roughly
+    (1 / bands) ** (bands / num_perm) similarity become candidates; the
+    defaults catch pairs from about 0.7 and the candidates are then checked
+    against ``threshold``.
+    """
+
+    SCHEMA = SCHEMA
+
+    def __init__(self, path=DEFAULT_DEDUPE_PATH, threshold=0.8, num_perm=128, bands=16, max_entries=50000):
+        """
+        Args:
+            path: SQLite database file
+            threshold: Estimated similarity from which two events count as duplicates
+            num_perm: MinHash signature length
+            bands: Number of LSH bands; must divide num_perm
+            max_entries: Maximum number of indexed events before the least recently seen are evicted
+        """
+        if num_perm % bands:
+            raise ValueError("bands must divide num_perm")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_entries = max_entries
+        self.checked = 0
+        self.duplicates = 0
+        self.skipped = 0
+        self._hasher = MinHasher(num_perm)
+        # URLs kept and links yielded during this run
+        self._run_urls = set()
+        self._run_links = set()
+        super().__init__(path)
+
+    def _prepare(self):
+        """Start a new index if the stored signatures were built with other parameters."""
+        parameters = f"{self._hasher.num_perm}/{self.bands}"
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'parameters'").fetchone()
+        if row is not None and row[0] != parameters:
+            logger.info(f"Dedupe index parameters changed ({row[0]} -> {parameters}); starting a new index")
+            self._conn.execute("DELETE FROM signatures")
+            self._conn.execute("DELETE FROM buckets")
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('parameters', ?)", (parameters,))
+
+    def signature(self, record):
+        """
+        Fingerprint an event.
+
+        Args:
+            record: Event details dict
+
+        Returns:
+            array: MinHash signature, or None for error records and records without usable text
+        """
+        if record.get("title") == ERROR_TITLE:
+            return None
+        features = event_features(record)
+        if not features:
+            return None
+        return self._hasher.signature(features)
+
+    def _buckets(self, signature):
+        for band in range(self.bands):
+            rows = signature[band * self.rows:(band + 1) * self.rows]
+            yield band, hashlib.blake2b(rows.tobytes(), digest_size=8).hexdigest()
+
+    def similar(self, signature, exclude_url=None):
+        """
+        Find indexed events similar to a signature.
+
+        Args:
+            signature: Signature returned by signature()
+            exclude_url: URL to leave out, typically the event itself
+
+        Returns:
+            list: (url, similarity, cluster_id) tuples at or above the
+                  threshold, most similar first
+        """
+        with self._lock:
+            candidates = set()
+            for band, bucket in self._buckets(signature):
+                rows = self._conn.execute("SELECT url FROM buckets WHERE band = ? AND bucket = ?", (band, bucket))
+                candidates.update(url for (url,) in rows)
+            candidates.discard(exclude_url)
+
+            matches = []
+            for url in candidates:
+                row = self._conn.execute("SELECT signature, cluster_id FROM signatures WHERE url = ?",
+                                         (url,)).fetchone()
+                if row is None:
+                    continue
+                stored = array("Q")
+                stored.frombytes(row[0])
+                similarity = estimated_similarity(signature, stored)
+                if similarity >= self.threshold:
+                    matches.append((url, similarity, row[1]))
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches
+
+    def check(self, record):
+        """
+        Classify an event and add it to the index.
+
+        Args:
+            record: Event details dict with a "url" key
+
+        Returns:
+            dict: cluster_id, duplicate_of (URL of a similar event already
+                  kept in this run, or None) and similarity; None if the
+                  record cannot be fingerprinted
+        """
+        url = record.get("url")
+        signature = self.signature(record)
+        if not url or signature is None:
+            return None
+
+        matches = self.similar(signature, exclude_url=url)
+        in_run = [match for match in matches if match[0] in self._run_urls]
+
+        with self._lock:
+            self.checked += 1
+            row = self._conn.execute("SELECT cluster_id FROM signatures WHERE url = ?", (url,)).fetchone()
+            if row is not None:
+                cluster_id = row[0]
+            elif matches:
+                cluster_id = matches[0][2]
+            else:
+                cluster_id = url
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO signatures (url, cluster_id, signature, title, seen_at) VALUES (?, ?, ?, ?, ?)",
+                (url, cluster_id, signature.tobytes(), record.get("title"), time.time()))
+            self._conn.execute("DELETE FROM buckets WHERE url = ?", (url,))
+            self._conn.executemany("INSERT INTO buckets (band, bucket, url) VALUES (?, ?, ?)",
+                                   [(band, bucket, url) for band, bucket in self._buckets(signature)])
+            self._evict()
+            self._conn.commit()
+
+            if in_run:
+                self.duplicates += 1
+            else:
+                self._run_urls.add(url)
+
+        if in_run:
+            logger.info(f"Near-duplicate event {url} of {in_run[0][0]} (similarity {in_run[0][1]:.2f})")
+        return {
+            "cluster_id": cluster_id,
+            "duplicate_of": in_run[0][0] if in_run else None,
+            "similarity": round(matches[0][1], 3) if matches else None,
+        }
+
+    def filter_links(self, event_links):
+        """
+        Skip links that an earlier run already clustered with another link of this run.
+
+        Args:
+            event_links: Iterable of event URLs, consumed lazily
+
+        Yields:
+            str: Event URLs that still need to be fetched
+        """
+        for link in event_links:
+            with self._lock:
+                row = self._conn.execute("SELECT cluster_id FROM signatures WHERE url = ?", (link,)).fetchone()
+                canonical = row[0] if row is not None and row[0] != link else None
+                skip = canonical is not None and canonical in self._run_links
+                if skip:
+                    self.skipped += 1
+                else:
+                    self._run_links.add(link)
+            if skip:
+                METRICS.increment("duplicates_skipped")
+                logger.info(f"Skipping {link}: known near-duplicate of {canonical}")
+                continue
+            yield link
+
+    def _evict(self):
+        """Drop the least recently seen events above max_entries. Caller holds the lock."""
+        count = self._conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            stale = "SELECT url FROM signatures ORDER BY seen_at ASC LIMIT ?"
+            self._conn.execute(f"DELETE FROM buckets WHERE url IN ({stale})", (excess,))
+            self._conn.execute(f"DELETE FROM signatures WHERE url IN ({stale})", (excess,))
+            logger.info(f"Evicted {excess} least recently seen events from the dedupe index")
+
+    def _log_stats(self):
+        logger.info(f"Dedupe index: {self.checked} events checked, {self.duplicates} near-duplicates, "
+                    f"{self.skipped} skipped before fetching")
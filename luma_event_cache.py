@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk cache of extracted Luma event details.
+
+Stores the dict returned by the event extractors in SQLite, keyed by event
+URL, together with the fetch time, a content hash and the HTTP validators
+(ETag / Last-Modified) of the page. Fresh entries are reused, expired ones
+can be revalidated with a conditional request, and the cache is bounded by
+evicting the least recently used entries.
+
+Usage:
+    from luma_event_cache import EventCache
+    cache = EventCache("luma_event_cache.sqlite", ttl=24 * 3600)
+    event = cache.get(url)
+    if event is None:
+        event = extract(url)
+        cache.put(url, event)
+"""
+
+import json
+import time
+import hashlib
+import logging
+
+from luma_sqlite_store import SqliteStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = "luma_event_cache.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    url TEXT PRIMARY KEY,
+    record TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_last_access ON events (last_access);
+"""
+
+def content_hash(record):
+    """
+    Compute a stable hash of an event record.
+
+    Args:
+        record: Event details dict
+
+    Returns:
+        str: SHA-256 hex digest of the canonical JSON form of the record
+    """
+    canonical = json.dumps(record, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+class EventCache(SqliteStore):
+    """SQLite-backed event cache with TTL-based reuse and LRU eviction."""
+
+    SCHEMA = SCHEMA
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=24 * 3600, max_entries=5000):
+        """
+        Args:
+            path: SQLite database file
+            ttl: Seconds an entry is reused without revalidation
+            max_entries: Maximum number of cached events before eviction
+        """
+        super().__init__(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    def get(self, url):
+        """
+        Return the cached record for a URL if it is still fresh.
+
+        Args:
+            url: Event URL
+
+        Returns:
+            dict: Cached event details, or None if missing or expired
+        """
+        entry = self.lookup(url)
+        if entry is None or time.time() - entry["fetched_at"] > self.ttl:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+            self._conn.execute("UPDATE events SET last_access = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+        return entry["record"]
+
+    def lookup(self, url):
+        """
+        Return the cache entry for a URL regardless of its age.
+
+        Args:
+            url: Event URL
+
+        Returns:
+            dict: Entry with record, content_hash, etag, last_modified and
+                  fetched_at keys, or None if the URL is not cached
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT record, content_hash, etag, last_modified, fetched_at FROM events WHERE url = ?",
+                (url,)).fetchone()
+        if row is None:
+            return None
+        return {
+            "record": json.loads(row[0]),
+            "content_hash": row[1],
+            "etag": row[2],
+            "last_modified": row[3],
+            "fetched_at": row[4],
+        }
+
+    def put(self, url, record, etag=None, last_modified=None):
+        """
+        Store a freshly extracted record.
+
+        Args:
+            url: Event URL
+            record: Event details dict
+            etag: ETag response header of the page, if known
+            last_modified: Last-Modified response header of the page, if known
+
+        Returns:
+            bool: True if the content changed since the previous cached version
+        """
+        digest = content_hash(record)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT content_hash FROM events WHERE url = ?", (url,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO events "
+                "(url, record, content_hash, etag, last_modified, fetched_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, json.dumps(record, ensure_ascii=False), digest, etag, last_modified, now, now))
+            self._evict()
+            self._conn.commit()
+
+        changed = row is None or row[0] != digest
+        if row is not None and not changed:
+            logger.info(f"Cached event unchanged after refetch: {url}")
+        return changed
+
+    def touch(self, url):
+        """Mark an entry as revalidated, restarting its TTL."""
+        now = time.time()
+        with self._lock:
+            self.revalidated += 1
+            self._conn.execute("UPDATE events SET fetched_at = ?, last_access = ? WHERE url = ?",
+                               (now, now, url))
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop least recently used entries above max_entries. Caller holds the lock."""
+        count = self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM events WHERE url IN "
+                "(SELECT url FROM events ORDER BY last_access ASC LIMIT ?)", (excess,))
+            logger.info(f"Evicted {excess} least recently used events from cache")
+
+    def _log_stats(self):
+        logger.info(f"Event cache: {self.hits} hits, {self.misses} misses, {self.revalidated} revalidated")
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Persistent full-text index of scraped Luma events.
+
+Every extracted event is added to an inverted index in SQLite: one posting
+per term and event, over the title, speakers and summary. Keyword queries
+are answered from the index with BM25 ranking, without starting a browser.
+Title and speaker terms weigh more than summary terms, so an event called
+"AI Builders Night" ranks above one that mentions AI once in its summary.
+
+Usage:
+    from luma_event_index import EventIndex
+    index = EventIndex("luma_event_index.sqlite")
+    index.add(event)
+    for score, event in index.search("ai agents", limit=10):
+        print(f"{score:.2f} {event['title']}")
+"""
+
+import re
+import json
+import math
+import time
+import logging
+
+from luma_structured_data import ERROR_TITLE
+from luma_sqlite_store import SqliteStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = "luma_event_index.sqlite"
+
+# Term frequency multiplier per field
+FIELD_WEIGHTS = {"title": 3.0, "speakers": 2.0, "summary": 1.0}
+
+# Words too common in event pages to help ranking
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of", "on",
+    "or", "our", "the", "this", "to", "we", "will", "with", "you", "your",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    url TEXT PRIMARY KEY,
+    record TEXT NOT NULL,
+    length REAL NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    url TEXT NOT NULL,
+    frequency REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS postings_term ON postings (term);
+CREATE INDEX IF NOT EXISTS postings_url ON postings (url);
+"""
+
+def tokenize(text):
+    """
+    Split text into lowercase index terms.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        list: Alphanumeric terms without stopwords, in order
+    """
+    return [term for term in re.findall(r"[a-z0-9]+", (text or "").lower()) if term not in STOPWORDS]
+
+def event_terms(record):
+    """
+    Count the weighted term frequencies of an event.
+
+    Args:
+        record: Event details dict
+
+    Returns:
+        dict: Term -> frequency, weighted by FIELD_WEIGHTS
+    """
+    speakers = " ".join(f"{speaker.get('name', '')} {speaker.get('title_company', '')}"
+                        for speaker in record.get("speakers") or [] if isinstance(speaker, dict))
+    fields = {"title": record.get("title"), "speakers": speakers, "summary": record.get("summary")}
+
+    frequencies = {}
+    for field, text in fields.items():
+        for term in tokenize(text):
+            frequencies[term] = frequencies.get(term, 0.0) + FIELD_WEIGHTS[field]
+    return frequencies
+
+class EventIndex(SqliteStore):
+    """
+    Inverted index of event records with BM25 ranking.
+
+    Re-adding an event replaces its postings.
+    """
+
+    SCHEMA = SCHEMA
+
+    def __init__(self, path=DEFAULT_INDEX_PATH, k1=1.2, b=0.75):
+        """
+        Args:
+            path: SQLite database file
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalisation
+        """
+        super().__init__(path)
+        self.k1 = k1
+        self.b = b
+        self.added = 0
+
+    def add(self, record):
+        """
+        Index an event record, replacing any earlier version of the same URL.
+
+        Args:
+            record: Event details dict with a "url" key
+
+        Returns:
+            bool: True if the record was indexed; error records and records
+                  without text are skipped
+        """
+        url = record.get("url")
+        if not url or record.get("title") == ERROR_TITLE:
+            return False
+        frequencies = event_terms(record)
+        if not frequencies:
+            return False
+
+        with self._lock:
+            self._conn.execute("DELETE FROM postings WHERE url = ?", (url,))
+            self._conn.executemany("INSERT INTO postings (term, url, frequency) VALUES (?, ?, ?)",
+                                   [(term, url, frequency) for term, frequency in frequencies.items()])
+            self._conn.execute(
+                "INSERT OR REPLACE INTO documents (url, record, length, indexed_at) VALUES (?, ?, ?, ?)",
+                (url, json.dumps(record, ensure_ascii=False), sum(frequencies.values()), time.time()))
+            self._conn.commit()
+            self.added += 1
+        return True
+
+    def search(self, query, limit=10, max_age=None):
+        """
+        Rank indexed events against a keyword query.
+
+        Args:
+            query: Free-text query; commas and other punctuation separate terms
+            limit: Maximum number of results; None returns every match
+            max_age: Only return events indexed within this many seconds
+
+        Returns:
+            list: (score, record) tuples, best match first
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        with self._lock:
+            count, total_length = self._conn.execute("SELECT COUNT(*), SUM(length) FROM documents").fetchone()
+            if not count:
+                return []
+            average_length = total_length / count
+
+            postings = {}
+            for term in terms:
+                postings[term] = self._conn.execute(
+                    "SELECT postings.url, postings.frequency, documents.length, documents.indexed_at "
+                    "FROM postings JOIN documents ON documents.url = postings.url WHERE postings.term = ?",
+                    (term,)).fetchall()
+
+            scores = {}
+            oldest = time.time() - max_age if max_age else None
+            for term, rows in postings.items():
+                idf = math.log(1 + (count - len(rows) + 0.5) / (len(rows) + 0.5))
+                for url, frequency, length, indexed_at in rows:
+                    if oldest is not None and indexed_at < oldest:
+                        continue
+                    norm = self.k1 * (1 - self.b + self.b * length / average_length)
+                    scores[url] = scores.get(url, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+            if limit is not None:
+                ranked = ranked[:limit]
+
+            results = []
+            for url, score in ranked:
+                row = self._conn.execute("SELECT record FROM documents WHERE url = ?", (url,)).fetchone()
+                results.append((score, json.loads(row[0])))
+        return results
+
+    def count(self):
+        """Return the number of indexed events."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def _log_stats(self):
+        if self.added:
+            logger.info(f"Event index: {self.added} events indexed")
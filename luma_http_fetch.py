@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+HTTP fetch engine for Luma event pages.
+
+Downloads event pages over a pooled keep-alive HTTP session and parses the
+static HTML directly, so that a full browser page load is only needed when the
+server-rendered markup does not contain the fields we are looking for.
+
+Usage:
+    from luma_http_fetch import create_http_session, fetch_event_details
+    session = create_http_session(pool_size=4)
+    event = fetch_event_details(session, "https://lu.ma/e/evt-...")
+"""
+
+import logging
+from contextlib import nullcontext
+from html.parser import HTMLParser
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from luma_structured_data import parse_structured_event, MAX_SUMMARY_LENGTH, PLACEHOLDER_VALUES
+from luma_rate_limiter import parse_retry_after
+from luma_metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+                   "(KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36"),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Elements that never have a closing tag and must not be pushed on the parser stack
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+
+# Elements whose text is never visible page content
+SKIPPED_ELEMENTS = {"script", "style", "noscript", "template", "svg"}
+
+def create_http_session(pool_size=10, retries=2):
+    """
+    Create a requests session with a keep-alive connection pool.
+
+    Args:
+        pool_size: Maximum number of pooled connections per host
+        retries: Number of retries for connection errors and 5xx responses
+
+    Returns:
+        requests.Session: Configured HTTP session
+    """
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+
+    retry = Retry(total=retries, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504),
+                  allowed_methods=frozenset(["GET", "HEAD"]))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+class EventPageParser(HTMLParser):
+    """
+    Single-pass parser collecting the event fields from static event page HTML.
+
+    Mirrors the XPath heuristics used in the browser path: the first ``h1``,
+    blocks whose class mentions ``host``/``speaker``, blocks whose class mentions
+    ``description``/``summary`` and paragraphs inside ``main``. Meta tags are
+    collected as well since they are always server-rendered.
+
+    Host blocks are nested on many pages (a ``hosts`` list wrapping one
+    ``host-row`` per person), so only the innermost host blocks are kept.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.meta = {}
+        self.page_title = ""
+        self.headings = []
+        self.host_blocks = []
+        self.summary_blocks = []
+        self.main_paragraphs = []
+        self._stack = []
+        self._captures = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+
+        if tag == "meta":
+            key = attrs.get("property") or attrs.get("name")
+            if key and attrs.get("content") and key not in self.meta:
+                self.meta[key] = attrs["content"].strip()
+            return
+
+        if tag in VOID_ELEMENTS:
+            if tag == "br":
+                self._break_line()
+            return
+
+        if tag in SKIPPED_ELEMENTS:
+            self._skip_depth += 1
+
+        classes = (attrs.get("class") or "").lower()
+        kind = None
+        if tag == "title" and not self.page_title:
+            kind = "page_title"
+        elif tag == "h1" and not self.headings:
+            kind = "heading"
+        elif tag == "div" and ("host" in classes or "speaker" in classes):
+            kind = "host"
+        elif tag == "div" and ("description" in classes or "summary" in classes):
+            kind = "summary"
+        elif tag == "p" and "main" in self._stack:
+            kind = "paragraph"
+
+        # Capture the outermost block of each kind, except for hosts where an
+        # inner block replaces the one around it when it closes
+        if kind and kind != "host" and any(capture[0] == kind for capture in self._captures):
+            kind = None
+
+        self._break_line()
+        self._stack.append(tag)
+        if kind:
+            self._captures.append((kind, len(self._stack), [[]], len(self.host_blocks)))
+
+    def handle_endtag(self, tag):
+        if tag in VOID_ELEMENTS or tag not in self._stack:
+            return
+
+        # Close any unclosed children together with this element
+        while self._stack:
+            open_tag = self._stack.pop()
+            self._close_element(open_tag)
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if self._skip_depth or not self._captures:
+            return
+        for _, _, lines, _ in self._captures:
+            lines[-1].append(data)
+
+    def close(self):
+        super().close()
+        while self._stack:
+            self._close_element(self._stack.pop())
+
+    def _break_line(self):
+        """Start a new text line in every active capture, like block elements render."""
+        for _, _, lines, _ in self._captures:
+            if lines[-1]:
+                lines.append([])
+
+    def _close_element(self, tag):
+        if tag in SKIPPED_ELEMENTS and self._skip_depth:
+            self._skip_depth -= 1
+        self._break_line()
+
+        # A capture ends once the stack drops below the element that opened it
+        while self._captures and self._captures[-1][1] > len(self._stack):
+            kind, _, lines, hosts_before = self._captures.pop()
+            text = [" ".join("".join(line).split()) for line in lines]
+            text = [line for line in text if line]
+            if kind == "page_title":
+                self.page_title = " ".join(text)
+            elif kind == "heading":
+                self.headings.append(" ".join(text))
+            elif kind == "host":
+                if len(self.host_blocks) == hosts_before:
+                    self.host_blocks.append(text)
+            elif kind == "summary":
+                self.summary_blocks.append(" ".join(text))
+            elif kind == "paragraph":
+                self.main_paragraphs.append(" ".join(text))
+
+def parse_event_html(html, event_url):
+    """
+    Parse event fields from static event page HTML.
+
+    Args:
+        html: Page source of the event page
+        event_url: URL of the event page
+
+    Returns:
+        dict: Event details including title, speakers, summary, and link.
+              Fields that are not present in the HTML keep their default values.
+    """
+    parser = EventPageParser()
+    parser.feed(html)
+    parser.close()
+
+    title = "Unknown Title"
+    title_candidates = [parser.meta.get("og:title"), parser.meta.get("twitter:title")]
+    title_candidates += parser.headings
+    title_candidates.append(parser.page_title.split(" · ")[0])
+    for candidate in title_candidates:
+        if candidate:
+            title = candidate
+            break
+
+    speakers = []
+    for lines in parser.host_blocks:
+        if lines:
+            speakers.append({
+                "name": lines[0],
+                "title_company": " ".join(lines[1:])
+            })
+
+    summary = "No summary available"
+    summary_candidates = [parser.meta.get("og:description"), parser.meta.get("description")]
+    summary_candidates += parser.summary_blocks + parser.main_paragraphs
+    for candidate in summary_candidates:
+        if candidate:
+            summary = candidate
+            break
+    if len(summary) > MAX_SUMMARY_LENGTH:
+        summary = summary[:MAX_SUMMARY_LENGTH - 3] + "..."
+
+    return {
+        "title": title,
+        "speakers": speakers,
+        "summary": summary,
+        "url": event_url
+    }
+
+def is_event_complete(event):
+    """
+    Check whether an extracted event has the fields we need.
+
+    Args:
+        event: Event details dict
+
+    Returns:
+        bool: True if the event has a title and speakers. A summary alone is
+              not enough: og:description is on nearly every page while the
+              hosts are often rendered client-side, so such pages are
+              completed by the browser instead.
+    """
+    has_title = bool(event.get("title")) and event["title"] not in PLACEHOLDER_VALUES
+    has_speakers = bool(event.get("speakers"))
+    return has_title and has_speakers
+
+def parse_event_page(html, event_url):
+    """
+    Parse an event page, preferring its embedded structured data.
+
+    Fields missing from the structured data are filled in from the static
+    markup heuristics of parse_event_html().
+
+    Args:
+        html: Page source of the event page
+        event_url: URL of the event page
+
+    Returns:
+        dict: Event details including title, speakers, summary, start time and link
+    """
+    event = parse_structured_event(html, event_url)
+    if event and is_event_complete(event):
+        return event
+
+    return merge_structured_event(parse_event_html(html, event_url), event)
+
+def merge_structured_event(fallback, structured):
+    """
+    Overlay the fields found in structured data on a markup-based record.
+
+    Used whenever structured data exists but is incomplete (typically no
+    hosts), so the HTTP and browser paths return the same record for a page.
+
+    Args:
+        fallback: Event details collected from the page markup
+        structured: Event details from parse_structured_event(), or None
+
+    Returns:
+        dict: The fallback record with a start time and every non-placeholder
+              structured field
+    """
+    fallback.setdefault("start_time", None)
+    if structured:
+        for key, value in structured.items():
+            if value and value not in PLACEHOLDER_VALUES:
+                fallback[key] = value
+    return fallback
+
+# Returned by fetch_event_page() when a conditional request says the page is unchanged
+NOT_MODIFIED = "not_modified"
+
+def fetch_event_page(session, event_url, timeout=10, etag=None, last_modified=None, rate_limiter=None):
+    """
+    Fetch an event page over HTTP, optionally as a conditional request.
+
+    Args:
+        session: requests.Session created by create_http_session()
+        event_url: URL of the event page
+        timeout: Request timeout in seconds
+        etag: ETag of a previously fetched version, sent as If-None-Match
+        last_modified: Last-Modified of a previously fetched version, sent as If-Modified-Since
+        rate_limiter: Optional HostRateLimiter the request has to pass
+
+    Returns:
+        tuple: (event, validators). event is the parsed details dict, NOT_MODIFIED
+               if the server confirmed the cached version, or None if the page
+               could not be fetched or lacks the required fields. validators is
+               a dict with the etag and last_modified response headers.
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    try:
+        logger.info(f"Fetching event page over HTTP: {event_url}")
+        with rate_limiter.request(event_url) if rate_limiter else nullcontext() as slot:
+            with METRICS.span("http.fetch"):
+                response = session.get(event_url, timeout=timeout, headers=headers)
+            METRICS.increment("http_pages_fetched")
+            METRICS.increment("http_bytes", len(response.content))
+            if slot is not None:
+                slot.report(status=response.status_code,
+                            retry_after=parse_retry_after(response.headers.get("Retry-After")))
+        if response.status_code == 304:
+            METRICS.increment("http_not_modified")
+            logger.info(f"Event page not modified: {event_url}")
+            return NOT_MODIFIED, {"etag": etag, "last_modified": last_modified}
+        response.raise_for_status()
+    except requests.RequestException as e:
+        METRICS.increment("http_errors")
+        logger.error(f"HTTP fetch failed for {event_url}: {str(e)}")
+        return None, {}
+
+    validators = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+
+    try:
+        with METRICS.span("http.parse"):
+            event = parse_event_page(response.text, event_url)
+    except Exception as e:
+        logger.error(f"Error parsing event HTML for {event_url}: {str(e)}")
+        return None, validators
+
+    if not is_event_complete(event):
+        METRICS.increment("http_incomplete_pages")
+        logger.info(f"Static HTML for {event_url} is missing event fields")
+        return None, validators
+
+    logger.info(f"Extracted event over HTTP: {event['title']}")
+    return event, validators
+
+def fetch_event_details(session, event_url, timeout=10):
+    """
+    Fetch an event page over HTTP and parse its details from the static HTML.
+
+    Args:
+        session: requests.Session created by create_http_session()
+        event_url: URL of the event page
+        timeout: Request timeout in seconds
+
+    Returns:
+        dict: Event details, or None if the page could not be fetched or the
+              static HTML does not contain the required fields
+    """
+    event, _ = fetch_event_page(session, event_url, timeout)
+    return event
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Run metrics for the Luma scrapers: per-phase timing spans and counters.
+
+Code paths wrap each phase (navigation, readiness waits, selector lookups,
+extraction, writing, ...) in a named span and bump counters such as pages
+fetched or bytes transferred. At the end of a run the totals are written as
+a JSON report and, optionally, in the Prometheus text exposition format for
+a node_exporter textfile collector or a push gateway.
+
+Usage:
+    from luma_metrics import METRICS
+
+    @METRICS.timed("event.total")
+    def extract(url):
+        ...
+
+    with METRICS.span("event.navigate"):
+        driver.get(url)
+    METRICS.increment("pages_fetched")
+    METRICS.write_json("run_metrics.json")
+"""
+
+import os
+import json
+import time
+import random
+import inspect
+import logging
+import functools
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+def _percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+def _prometheus_name(name):
+    return "".join(char if char.isalnum() else "_" for char in name)
+
+# Span durations kept per name for the percentiles; count, total and max are exact
+SPAN_RESERVOIR_SIZE = 1024
+
+class _SpanStats:
+    """Count, total and maximum of one span name plus a uniform reservoir sample of its durations."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = []
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        if len(self.samples) < SPAN_RESERVOIR_SIZE:
+            self.samples.append(seconds)
+        else:
+            # Algorithm R: every duration seen so far is kept with equal probability
+            index = random.randrange(self.count)
+            if index < SPAN_RESERVOIR_SIZE:
+                self.samples[index] = seconds
+
+    def merge(self, exported):
+        """Add the stats of export() from another instance, keeping the reservoir uniform."""
+        count = exported["count"]
+        if not count:
+            return
+        samples = list(self.samples) + list(exported["samples"])
+        if len(samples) > SPAN_RESERVOIR_SIZE:
+            # Draw from each side in proportion to the spans it stands for
+            own = round(SPAN_RESERVOIR_SIZE * self.count / (self.count + count))
+            own = min(own, len(self.samples))
+            other = min(SPAN_RESERVOIR_SIZE - own, len(exported["samples"]))
+            samples = random.sample(self.samples, own) + random.sample(list(exported["samples"]), other)
+        self.samples = samples
+        self.count += count
+        self.total += exported["total"]
+        self.max = max(self.max, exported["max"])
+
+    def export(self):
+        return {"count": self.count, "total": self.total, "max": self.max, "samples": list(self.samples)}
+
+class RunMetrics:
+    """
+    Thread-safe collection of timing spans and counters for one run.
+
+    Each span name keeps an exact count, total and maximum plus a bounded
+    reservoir of durations for the percentiles, so memory stays flat in
+    long-lived processes such as the daemon. The stats of worker processes
+    can be merged into the parent.
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self._spans = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name):
+        """Time the enclosed block and record it under ``name``."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record_span(name, time.monotonic() - start)
+
+    def timed(self, name):
+        """
+        Decorator recording every call of a function as a span.
+
+        For generator functions only the time spent producing items counts,
+        not the time the caller spends between items.
+        """
+        def decorator(function):
+            if inspect.isgeneratorfunction(function):
+                @functools.wraps(function)
+                def generator_wrapper(*args, **kwargs):
+                    return self.timed_iter(name, function(*args, **kwargs))
+                return generator_wrapper
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def timed_iter(self, name, iterable):
+        """Yield from ``iterable``, recording the time spent inside it as one span."""
+        elapsed = 0.0
+        iterator = iter(iterable)
+        try:
+            while True:
+                start = time.monotonic()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += time.monotonic() - start
+                yield item
+        finally:
+            self.record_span(name, elapsed)
+
+    def record_span(self, name, seconds):
+        """Record a duration measured by the caller."""
+        with self._lock:
+            if name not in self._spans:
+                self._spans[name] = _SpanStats()
+            self._spans[name].add(seconds)
+
+    def increment(self, name, amount=1):
+        """Add ``amount`` to a counter."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def reset(self):
+        """Drop all samples, e.g. in a forked worker process that inherited the parent's."""
+        with self._lock:
+            self.started_at = time.time()
+            self._spans = {}
+            self._counters = {}
+
+    def export(self):
+        """
+        Return the raw span stats, e.g. to send them from a worker process.
+
+        Returns:
+            dict: {"spans": {name: {count, total, max, samples}}, "counters": {name: value}}
+        """
+        with self._lock:
+            return {
+                "spans": {name: stats.export() for name, stats in self._spans.items()},
+                "counters": dict(self._counters),
+            }
+
+    def merge(self, exported):
+        """Add the samples returned by export() of another RunMetrics."""
+        with self._lock:
+            for name, stats in exported.get("spans", {}).items():
+                if name not in self._spans:
+                    self._spans[name] = _SpanStats()
+                self._spans[name].merge(stats)
+            for name, value in exported.get("counters", {}).items():
+                self._counters[name] = self._counters.get(name, 0) + value
+
+    def summary(self):
+        """
+        Summarise the spans and counters.
+
+        Returns:
+            dict: {"spans": {name: {count, total_seconds, mean_seconds,
+                   p50_seconds, p95_seconds, max_seconds}}, "counters": {...}}
+        """
+        exported = self.export()
+        spans = {}
+        for name, stats in sorted(exported["spans"].items()):
+            durations = sorted(stats["samples"])
+            spans[name] = {
+                "count": stats["count"],
+                "total_seconds": round(stats["total"], 4),
+                "mean_seconds": round(stats["total"] / stats["count"], 4),
+                "p50_seconds": round(_percentile(durations, 0.5), 4),
+                "p95_seconds": round(_percentile(durations, 0.95), 4),
+                "max_seconds": round(stats["max"], 4),
+            }
+        return {"spans": spans, "counters": dict(sorted(exported["counters"].items()))}
+
+    def report(self, **extra):
+        """
+        Build the end-of-run report.
+
+        Args:
+            **extra: Additional top-level sections, e.g. run parameters
+
+        Returns:
+            dict: Run start time and duration, spans, counters and the extra sections
+        """
+        report = {
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started_at)),
+            "duration_seconds": round(time.time() - self.started_at, 3),
+        }
+        report.update(self.summary())
+        report.update(extra)
+        return report
+
+    def write_json(self, path, **extra):
+        """Write report() to a JSON file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(**extra), f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        logger.info(f"Run metrics saved to: {path}")
+
+    def to_prometheus(self, prefix="luma_scraper"):
+        """
+        Render the spans and counters in the Prometheus text exposition format.
+
+        Spans become one summary metric labelled by phase; every counter becomes
+        its own ``<prefix>_<name>_total`` counter.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            str: Exposition text
+        """
+        summary = self.summary()
+        lines = [
+            f"# HELP {prefix}_run_duration_seconds Wall-clock duration of the run.",
+            f"# TYPE {prefix}_run_duration_seconds gauge",
+            f"{prefix}_run_duration_seconds {time.time() - self.started_at:.3f}",
+        ]
+
+        if summary["spans"]:
+            metric = f"{prefix}_phase_seconds"
+            lines += [f"# HELP {metric} Time spent in each phase of the run.",
+                      f"# TYPE {metric} summary"]
+            for phase, stats in summary["spans"].items():
+                labels = f'phase="{phase}"'
+                lines.append(f'{metric}{{{labels},quantile="0.5"}} {stats["p50_seconds"]}')
+                lines.append(f'{metric}{{{labels},quantile="0.95"}} {stats["p95_seconds"]}')
+                lines.append(f"{metric}_sum{{{labels}}} {stats['total_seconds']}")
+                lines.append(f"{metric}_count{{{labels}}} {stats['count']}")
+
+        for name, value in summary["counters"].items():
+            metric = f"{prefix}_{_prometheus_name(name)}_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path, prefix="luma_scraper"):
+        """Write to_prometheus() to a file."""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus(prefix))
+        # Rename so that a textfile collector never reads a half-written file
+        os.replace(tmp_path, path)
+        logger.info(f"Prometheus metrics saved to: {path}")
+
+    def log_summary(self, limit=10):
+        """Log the phases that took the most time in total, and all counters."""
+        summary = self.summary()
+        phases = sorted(summary["spans"].items(), key=lambda item: item[1]["total_seconds"], reverse=True)
+        for phase, stats in phases[:limit]:
+            logger.info(f"Phase '{phase}': {stats['count']} spans, total {stats['total_seconds']:.2f}s, "
+                        f"p50 {stats['p50_seconds']:.3f}s, p95 {stats['p95_seconds']:.3f}s")
+        if summary["counters"]:
+            counters = ", ".join(f"{name}={value}" for name, value in summary["counters"].items())
+            logger.info(f"Counters: {counters}")
+
+# Shared by all modules of one process
+METRICS = RunMetrics()
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Incremental output writers for extracted Luma events.
+
+Every writer receives event dicts one at a time, buffers them and flushes
+after a number of records or seconds, so that long runs keep their output on
+disk as they go. Writers are context managers and flush everything on close,
+including when the run is interrupted.
+
+Formats:
+    text     Human-readable report (the original output)
+    jsonl    One JSON object per line
+    csv      One row per event; speakers and matched keywords are stored as JSON arrays
+    parquet  Columnar file for bulk loading (requires pyarrow)
+
+Modes:
+    overwrite  Replace the output file
+    append     Add records after the existing ones
+    merge      Add records, then keep only the latest record per event URL
+
+Usage:
+    from luma_output_writers import create_writer
+    with create_writer("jsonl", "events.jsonl", mode="merge") as writer:
+        for event in events:
+            writer.write(event)
+"""
+
+import os
+import csv
+import json
+import time
+import logging
+import datetime
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# Columns of the tabular formats; extra keys of an event are ignored
+EVENT_FIELDS = ["url", "title", "start_time", "speakers", "summary", "matched_keywords", "city", "cluster_id"]
+
+# List-valued fields, stored as JSON arrays in CSV
+LIST_FIELDS = ("speakers", "matched_keywords")
+
+FILE_EXTENSIONS = {"text": "txt", "jsonl": "jsonl", "csv": "csv", "parquet": "parquet"}
+
+WRITE_MODES = ("overwrite", "append", "merge")
+
+class EventWriter:
+    """
+    Base class for buffered, incremental event writers.
+
+    Subclasses implement _flush_records() to persist a batch of records and may
+    override _finish() for work that has to happen once at the end.
+    """
+
+    def __init__(self, path, mode="overwrite", flush_every=20, flush_interval=2.0):
+        """
+        Args:
+            path: Output file path
+            mode: "overwrite", "append" or "merge"
+            flush_every: Flush after this many buffered records
+            flush_interval: Flush when the oldest buffered record is this many seconds old
+        """
+        if mode not in WRITE_MODES:
+            raise ValueError(f"Unknown write mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.flush_every = max(1, flush_every)
+        self.flush_interval = flush_interval
+        self.count = 0
+        self._buffer = []
+        self._buffered_since = None
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def write(self, event):
+        """Buffer one event and flush if the buffer is full or old enough."""
+        if not self._buffer:
+            self._buffered_since = time.monotonic()
+        self._buffer.append(event)
+        self.count += 1
+
+        if (len(self._buffer) >= self.flush_every
+                or time.monotonic() - self._buffered_since >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Persist all buffered events."""
+        if self._buffer:
+            self._flush_records(self._buffer)
+            self._buffer = []
+
+    def close(self):
+        """Flush remaining events and finalise the file. Safe to call twice."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.flush()
+        finally:
+            self._finish()
+        if self.count:
+            logger.info(f"Wrote {self.count} events to {self.path}")
+
+    def _flush_records(self, records):
+        raise NotImplementedError
+
+    def _finish(self):
+        pass
+
+class LineEventWriter(EventWriter):
+    """Base class for formats that can be appended to line by line."""
+
+    def __init__(self, path, mode="overwrite", **kwargs):
+        super().__init__(path, mode, **kwargs)
+        self._file = None
+
+    def _open(self):
+        if self._file is None:
+            appending = self.mode in ("append", "merge") and os.path.exists(self.path)
+            self._file = open(self.path, "a" if appending else "w", newline="", encoding="utf-8")
+            self._start_file(appending)
+        return self._file
+
+    def _start_file(self, appending):
+        pass
+
+    def _flush_records(self, records):
+        f = self._open()
+        for record in records:
+            self._write_record(f, record)
+        f.flush()
+
+    def _write_record(self, f, record):
+        raise NotImplementedError
+
+    def _finish(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.mode == "merge" and os.path.exists(self.path):
+            self._compact()
+
+    def _read_records(self):
+        raise NotImplementedError
+
+    def _compact(self):
+        """Rewrite the file keeping only the latest record per event URL."""
+        latest = {}
+        for record in self._read_records():
+            key = record.get("url")
+            latest.pop(key, None)
+            latest[key] = record
+
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+            self._start_file_handle(f)
+            for record in latest.values():
+                self._write_record(f, record)
+        os.replace(tmp_path, self.path)
+        logger.info(f"Merged output to {len(latest)} unique events in {self.path}")
+
+    def _start_file_handle(self, f):
+        pass
+
+class TextEventWriter(LineEventWriter):
+    """Human-readable text report, flushed after every event."""
+
+    def __init__(self, path, mode="overwrite", keywords=None, **kwargs):
+        if mode == "merge":
+            raise ValueError("The text report does not support merge mode")
+        kwargs.setdefault("flush_every", 1)
+        super().__init__(path, mode, **kwargs)
+        self.keywords = keywords
+
+    def _start_file(self, appending):
+        if appending:
+            self._file.write("\n")
+        self._file.write(f"Luma SF Events Detailed Results\n")
+        self._file.write(f"Search keywords: {self.keywords or 'N/A'}\n")
+        self._file.write(f"Generated on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        self._event_number = 0
+
+    def _write_record(self, f, event):
+        self._event_number += 1
+        f.write(f"Event {self._event_number}:\n")
+        f.write(f"Title: {event.get('title', 'Unknown')}\n")
+        if event.get('city'):
+            f.write(f"City: {event['city']}\n")
+
+        # Write speakers
+        speakers = event.get('speakers', [])
+        if speakers:
+            f.write("Speakers:\n")
+            for speaker in speakers:
+                f.write(f"  - {speaker.get('name', 'Unknown')}")
+                if speaker.get('title_company'):
+                    f.write(f", {speaker.get('title_company')}")
+                f.write("\n")
+        else:
+            f.write("Speakers: None listed\n")
+
+        if event.get('start_time'):
+            f.write(f"Start time: {event['start_time']}\n")
+
+        if event.get('matched_keywords'):
+            f.write(f"Matched keywords: {', '.join(event['matched_keywords'])}\n")
+
+        # Write summary
+        f.write(f"Summary: {event.get('summary', 'No summary available')}\n")
+        f.write(f"URL: {event.get('url', 'Unknown')}\n")
+        if event.get('cluster_id') and event['cluster_id'] != event.get('url'):
+            f.write(f"Near-duplicate of: {event['cluster_id']}\n")
+        f.write("\n")
+
+class JsonlEventWriter(LineEventWriter):
+    """One JSON object per line."""
+
+    def _write_record(self, f, record):
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def _read_records(self):
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # A run killed mid-line leaves a truncated last record
+                    logger.error(f"Skipping unreadable line in {self.path}")
+
+class CsvEventWriter(LineEventWriter):
+    """One row per event, with list fields such as speakers stored as JSON arrays."""
+
+    def __init__(self, path, mode="overwrite", **kwargs):
+        super().__init__(path, mode, **kwargs)
+        self._fields = EVENT_FIELDS
+
+    def _start_file(self, appending):
+        if not appending or os.path.getsize(self.path) == 0:
+            self._start_file_handle(self._file)
+            return
+
+        # Keep the columns of the existing file, which may predate newer fields
+        with open(self.path, newline="", encoding="utf-8") as f:
+            header = next(csv.reader(f), None)
+        if header:
+            self._fields = header
+
+    def _start_file_handle(self, f):
+        self._fields = EVENT_FIELDS
+        csv.writer(f).writerow(EVENT_FIELDS)
+
+    def _write_record(self, f, record):
+        row = dict(record)
+        for field in LIST_FIELDS:
+            row[field] = json.dumps(record.get(field) or [], ensure_ascii=False)
+        csv.DictWriter(f, self._fields, extrasaction="ignore").writerow(row)
+
+    def _read_records(self):
+        with open(self.path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                for field in LIST_FIELDS:
+                    try:
+                        row[field] = json.loads(row.get(field) or "[]")
+                    except ValueError:
+                        row[field] = []
+                yield row
+
+class ParquetEventWriter(EventWriter):
+    """
+    Columnar Parquet output written one row group per flush.
+
+    Row groups go to a ``.part`` file that replaces the output on close; in
+    append and merge mode the existing file is combined with the new rows.
+    """
+
+    def __init__(self, path, mode="overwrite", **kwargs):
+        if pq is None:
+            raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow)")
+        kwargs.setdefault("flush_every", 500)
+        super().__init__(path, mode, **kwargs)
+        self._part_path = path + ".part"
+        self._writer = None
+        self._schema = pa.schema([
+            ("url", pa.string()),
+            ("title", pa.string()),
+            ("start_time", pa.string()),
+            ("speakers", pa.list_(pa.struct([("name", pa.string()), ("title_company", pa.string())]))),
+            ("summary", pa.string()),
+            ("matched_keywords", pa.list_(pa.string())),
+            ("city", pa.string()),
+            ("cluster_id", pa.string()),
+        ])
+
+    def _flush_records(self, records):
+        columns = {field: [record.get(field) for record in records] for field in EVENT_FIELDS}
+        table = pa.Table.from_pydict(columns, schema=self._schema)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self._part_path, self._schema)
+        self._writer.write_table(table)
+
+    def _finish(self):
+        if self._writer is None:
+            return
+        self._writer.close()
+        self._writer = None
+
+        exists = os.path.exists(self.path)
+        if self.mode == "overwrite" or (self.mode == "append" and not exists):
+            os.replace(self._part_path, self.path)
+            return
+
+        # Merge mode also compacts a first run, which may list an event twice
+        combined = pq.read_table(self._part_path, schema=self._schema)
+        if exists:
+            combined = pa.concat_tables([self._read_existing(), combined])
+        if self.mode == "merge":
+            # Keep the last row per URL
+            urls = combined.column("url").to_pylist()
+            last_row = {url: index for index, url in enumerate(urls)}
+            combined = combined.take(sorted(last_row.values()))
+        tmp_path = self.path + ".tmp"
+        pq.write_table(combined, tmp_path)
+        os.replace(tmp_path, self.path)
+        os.remove(self._part_path)
+
+    def _read_existing(self):
+        """Read the existing output, adding empty columns for fields it predates."""
+        table = pq.read_table(self.path)
+        columns = []
+        for field in self._schema:
+            if field.name in table.column_names:
+                columns.append(table.column(field.name).cast(field.type))
+            else:
+                columns.append(pa.nulls(len(table), field.type))
+        return pa.Table.from_arrays(columns, schema=self._schema)
+
+WRITERS = {
+    "text": TextEventWriter,
+    "jsonl": JsonlEventWriter,
+    "csv": CsvEventWriter,
+    "parquet": ParquetEventWriter,
+}
+
+def create_writer(output_format, path, mode="overwrite", keywords=None):
+    """
+    Create an output writer for a format.
+
+    Args:
+        output_format: One of "text", "jsonl", "csv" or "parquet"
+        path: Output file path
+        mode: "overwrite", "append" or "merge"
+        keywords: Search keywords, recorded in the text report header
+
+    Returns:
+        EventWriter: Writer instance, to be closed when the run ends
+    """
+    if output_format == "text":
+        return TextEventWriter(path, mode, keywords=keywords)
+    return WRITERS[output_format](path, mode)
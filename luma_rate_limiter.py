@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Adaptive per-host rate limiter for Luma page loads.
+
+Every page load, over HTTP or in the browser, first takes a token from the
+bucket of its host. Buckets refill at the host's current rate, and a cap on
+concurrent requests per host applies on top. The rate adapts to how the site
+responds: it is cut on 429s, error pages and slow responses, honours any
+Retry-After delay, and grows back step by step while requests succeed.
+
+Usage:
+    from luma_rate_limiter import HostRateLimiter
+    limiter = HostRateLimiter(rate=2.0, max_concurrency=4)
+    with limiter.request(url) as slot:
+        response = session.get(url)
+        slot.report(status=response.status_code)
+"""
+
+import time
+import logging
+import threading
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Status codes meaning the site wants us to slow down
+THROTTLE_STATUSES = (429, 503)
+
+class _HostState:
+    """Token bucket and adaptive rate of one host."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        self.slow = 0
+
+class RequestSlot:
+    """
+    Permission to make one request to a host, returned by HostRateLimiter.request().
+
+    The outcome is reported with report(); a slot left without a report counts
+    as a plain success, and an exception inside the ``with`` block as an error.
+    """
+
+    def __init__(self, limiter, host):
+        self.limiter = limiter
+        self.host = host
+        self.started_at = time.monotonic()
+        self._outcome = None
+
+    def report(self, status=None, throttled=False, error=False, retry_after=None):
+        """
+        Record how the request went.
+
+        Args:
+            status: HTTP status code, if known
+            throttled: Whether the response was a rate limit or block page
+            error: Whether the request failed
+            retry_after: Seconds the server asked us to wait, if any
+        """
+        self._outcome = {"status": status, "throttled": throttled, "error": error, "retry_after": retry_after}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        outcome = self._outcome or {}
+        if exc_type is not None:
+            outcome = dict(outcome, error=True)
+        self.limiter.release(self.host, time.monotonic() - self.started_at, **outcome)
+        return False
+
+class HostRateLimiter:
+    """
+    Token-bucket scheduler with a concurrency cap and adaptive rate per host.
+
+    The rate follows an additive-increase, multiplicative-decrease scheme:
+    every throttled or failed request multiplies it by ``backoff_factor``,
+    every slow one by ``slow_factor``, and every successful one adds
+    ``recovery_step`` until ``rate`` is reached again. Thread-safe; share one
+    instance between all workers.
+    """
+
+    def __init__(self, rate=2.0, max_concurrency=4, burst=None, min_rate=0.1, slow_threshold=5.0,
+                 backoff_factor=0.5, slow_factor=0.8, recovery_step=None):
+        """
+        Args:
+            rate: Maximum requests per second per host
+            max_concurrency: Maximum concurrent requests per host
+            burst: Bucket size, i.e. requests that may start back to back (default: max(1, rate))
+            min_rate: Lowest rate backoff can go down to
+            slow_threshold: Seconds after which a response counts as slow
+            backoff_factor: Rate multiplier after a throttled or failed request
+            slow_factor: Rate multiplier after a slow response
+            recovery_step: Rate added after each successful request (default: rate / 20)
+        """
+        self._hosts = {}
+        self._condition = threading.Condition()
+        self.configure(rate, max_concurrency, burst, min_rate, slow_threshold, backoff_factor,
+                       slow_factor, recovery_step)
+
+    def configure(self, rate=2.0, max_concurrency=4, burst=None, min_rate=0.1, slow_threshold=5.0,
+                  backoff_factor=0.5, slow_factor=0.8, recovery_step=None):
+        """Change the limits; see __init__() for the arguments. Resets per-host state."""
+        with self._condition:
+            self.max_rate = max(rate, min_rate)
+            self.max_concurrency = max(1, max_concurrency)
+            self.burst = burst if burst is not None else max(1.0, rate)
+            self.min_rate = min_rate
+            self.slow_threshold = slow_threshold
+            self.backoff_factor = backoff_factor
+            self.slow_factor = slow_factor
+            self.recovery_step = recovery_step if recovery_step is not None else self.max_rate / 20
+            self._hosts = {}
+            self._condition.notify_all()
+
+    def _state(self, host):
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.max_rate, self.burst)
+        return state
+
+    def _refill(self, state, now):
+        state.tokens = min(self.burst, state.tokens + (now - state.updated_at) * state.rate)
+        state.updated_at = now
+
+    def acquire(self, url):
+        """
+        Block until a request to the host of ``url`` is allowed.
+
+        Args:
+            url: URL about to be requested
+
+        Returns:
+            str: Host the request was counted against; pass it to release()
+        """
+        host = urlparse(url).netloc or url
+        with self._condition:
+            state = self._state(host)
+            while True:
+                now = time.monotonic()
+                self._refill(state, now)
+                if now >= state.blocked_until and state.in_flight < self.max_concurrency and state.tokens >= 1:
+                    state.tokens -= 1
+                    state.in_flight += 1
+                    state.requests += 1
+                    return host
+
+                if now < state.blocked_until:
+                    wait = state.blocked_until - now
+                elif state.in_flight >= self.max_concurrency:
+                    # Woken up by release()
+                    wait = None
+                else:
+                    wait = (1 - state.tokens) / state.rate
+                self._condition.wait(wait)
+
+    def release(self, host, elapsed, status=None, throttled=False, error=False, retry_after=None):
+        """
+        Finish a request and adapt the host's rate to its outcome.
+
+        Args:
+            host: Host returned by acquire()
+            elapsed: Request duration in seconds
+            status: HTTP status code, if known
+            throttled: Whether the response was a rate limit or block page
+            error: Whether the request failed
+            retry_after: Seconds the server asked us to wait, if any
+        """
+        with self._condition:
+            state = self._state(host)
+            state.in_flight = max(0, state.in_flight - 1)
+            previous_rate = state.rate
+            now = time.monotonic()
+            self._refill(state, now)
+
+            if throttled or status in THROTTLE_STATUSES:
+                state.throttled += 1
+                state.rate = max(self.min_rate, state.rate * self.backoff_factor)
+                state.tokens = 0
+                if retry_after:
+                    state.blocked_until = max(state.blocked_until, now + retry_after)
+                reason = f"status {status}" if status else "block page"
+                logger.info(f"Throttled by {host} ({reason}); rate {previous_rate:.2f} -> {state.rate:.2f}/s")
+            elif error or (status is not None and status >= 500):
+                state.rate = max(self.min_rate, state.rate * self.backoff_factor)
+                logger.info(f"Request to {host} failed; rate {previous_rate:.2f} -> {state.rate:.2f}/s")
+            elif elapsed > self.slow_threshold:
+                state.slow += 1
+                state.rate = max(self.min_rate, state.rate * self.slow_factor)
+                logger.info(f"Slow response from {host} ({elapsed:.1f}s); rate {previous_rate:.2f} -> {state.rate:.2f}/s")
+            else:
+                state.rate = min(self.max_rate, state.rate + self.recovery_step)
+
+            self._condition.notify_all()
+
+    def request(self, url):
+        """
+        Wait for permission to request ``url``.
+
+        Returns:
+            RequestSlot: Context manager that releases the slot on exit
+        """
+        return RequestSlot(self, self.acquire(url))
+
+    def stats(self):
+        """
+        Return per-host counters.
+
+        Returns:
+            dict: Host -> dict with requests, throttled, slow and the current rate
+        """
+        with self._condition:
+            return {host: {"requests": state.requests, "throttled": state.throttled,
+                           "slow": state.slow, "rate": round(state.rate, 3)}
+                    for host, state in self._hosts.items()}
+
+    def log_stats(self):
+        """Log how many requests went to each host and how often we were throttled."""
+        for host, stats in sorted(self.stats().items()):
+            logger.info(f"Rate limiter {host}: {stats['requests']} requests, {stats['throttled']} throttled, "
+                        f"{stats['slow']} slow, final rate {stats['rate']:.2f}/s")
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header given in seconds.
+
+    Args:
+        value: Header value or None
+
+    Returns:
+        float: Seconds to wait, or None if the header is missing or an HTTP date
+    """
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Warm Luma scraper daemon with a local query API
+
+Keeps browser sessions running and parked on the Luma SF page, so keyword
+lookups skip Chrome startup and the initial page load. Queries are served
+over a small HTTP API on localhost and answered with the same event dicts the
+command-line scraper produces.
+
+Usage:
+    python luma_scraper_daemon.py --headless --port 8787
+    curl "http://127.0.0.1:8787/search?keywords=AI&max_events=5"
+    curl "http://127.0.0.1:8787/search?keywords=AI,robotics&max_events=10"
+    curl "http://127.0.0.1:8787/query?q=ai+agents&max_events=10"
+    curl "http://127.0.0.1:8787/health"
+    curl "http://127.0.0.1:8787/metrics"
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from luma_sf_events_detailed import (
+    DriverPool, create_driver, is_driver_alive, configure_rate_limiter, RATE_LIMITER, open_city_page, split_keywords, fan_out_search,
+    extract_events_parallel,
+)
+from luma_http_fetch import create_http_session
+from luma_event_cache import EventCache, DEFAULT_CACHE_PATH
+from luma_event_index import EventIndex, DEFAULT_INDEX_PATH
+from luma_metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description='Warm Luma scraper daemon')
+
+    # API parameters
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8787, help='Port to listen on (default: 8787)')
+
+    # Browser parameters
+    parser.add_argument('--search-sessions', type=int, default=1, help='Warm browser sessions kept on the SF page for searches (default: 1)')
+    parser.add_argument('--detail-sessions', type=int, default=2, help='Browser sessions used to extract event details (default: 2)')
+    parser.add_argument('--wait-time', type=int, default=5, help='Maximum wait time in seconds for page loading (default: 5)')
+    parser.add_argument('--max-events', type=int, default=10, help='Default maximum number of events per query (default: 10)')
+    parser.add_argument('--headless', action='store_true', help='Run browser in headless mode')
+    parser.add_argument('--lean', action='store_true', help='Use the lean browser profile')
+    parser.add_argument('--chromedriver-path', help='Path to chromedriver executable (optional)')
+    parser.add_argument('--rate-limit', type=float, default=2.0, help='Maximum page loads per second per host (default: 2.0)')
+    parser.add_argument('--max-host-concurrency', type=int, default=4, help='Maximum concurrent page loads per host (default: 4)')
+    parser.add_argument('--fetch-mode', choices=['browser', 'http'], default='http',
+                        help='How to load event pages (default: http)')
+    parser.add_argument('--extraction-mode', choices=['dom', 'script'], default='script',
+                        help='How to read pages in the browser (default: script)')
+
+    # Cache parameters
+    parser.add_argument('--cache-path', default=DEFAULT_CACHE_PATH, help=f'Event detail cache database (default: {DEFAULT_CACHE_PATH})')
+    parser.add_argument('--cache-ttl', type=float, default=24, help='Hours a cached event is reused; 0 disables the cache (default: 24)')
+    parser.add_argument('--index-path', default=DEFAULT_INDEX_PATH, help=f'Full-text index queried by /query and fed by /search (default: {DEFAULT_INDEX_PATH})')
+
+    return parser.parse_args()
+
+class ScraperDaemon:
+    """
+    Long-lived scraper holding warm browser sessions.
+
+    Search sessions are kept on the SF page between queries; after each search
+    the session is sent back to the SF page in the background. Event details
+    are extracted on a separate pool, through the event cache.
+    """
+
+    def __init__(self, args):
+        """
+        Args:
+            args: Parsed command-line arguments
+        """
+        self.args = args
+        configure_rate_limiter(args)
+        self.search_pool = DriverPool(lambda: create_driver(args), size=args.search_sessions)
+        self.detail_pool = DriverPool(lambda: create_driver(args), size=args.detail_sessions)
+        self.http_session = None
+        if args.fetch_mode == 'http':
+            self.http_session = create_http_session(pool_size=max(args.detail_sessions, 1))
+        self.cache = None
+        if args.cache_ttl > 0:
+            self.cache = EventCache(args.cache_path, ttl=args.cache_ttl * 3600)
+        self.index = EventIndex(args.index_path)
+        self.queries = 0
+        self.started_at = time.time()
+
+    def warm_up(self):
+        """Start every search session and park it on the SF page."""
+        logger.info(f"Warming up {self.args.search_sessions} search sessions")
+        drivers = []
+
+        def start():
+            try:
+                driver = self.search_pool.acquire()
+            except Exception as e:
+                logger.error(f"Could not start search session: {str(e)}")
+                return
+            try:
+                open_city_page(driver, self.args.wait_time)
+            except Exception as e:
+                logger.error(f"Error opening SF page: {str(e)}")
+            drivers.append(driver)
+
+        threads = [threading.Thread(target=start) for _ in range(self.args.search_sessions)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for driver in drivers:
+            self.search_pool.release(driver)
+        logger.info("Search sessions are warm")
+
+    def _rewarm(self, driver):
+        """Send a search session back to the SF page, then return it to the pool."""
+        def run():
+            try:
+                open_city_page(driver, self.args.wait_time)
+            except Exception as e:
+                logger.error(f"Error re-warming search session: {str(e)}")
+            if is_driver_alive(driver):
+                self.search_pool.release(driver)
+            else:
+                self.search_pool.discard(driver)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def search(self, keywords, max_events):
+        """
+        Run one query; comma-separated keywords are searched concurrently.
+
+        Args:
+            keywords: Comma-separated keywords to search for
+            max_events: Maximum number of events to return
+
+        Returns:
+            list: Event dicts, ranked by the number of matching keywords
+        """
+        self.queries += 1
+        ranked = fan_out_search(self.search_pool, split_keywords(keywords), max_events=max_events,
+                                wait_time=self.args.wait_time, extraction_mode=self.args.extraction_mode,
+                                reuse_page=True, release=self._rewarm)[:max_events]
+
+        events = extract_events_parallel(self.detail_pool, [entry["url"] for entry in ranked],
+                                         self.args.wait_time, workers=self.args.detail_sessions,
+                                         http_session=self.http_session,
+                                         extraction_mode=self.args.extraction_mode, cache=self.cache)
+        events = [dict(event, matched_keywords=entry["keywords"]) for entry, event in zip(ranked, events)]
+        for event in events:
+            self.index.add(event)
+        return events
+
+    def query(self, query, max_events):
+        """
+        Answer a keyword query from the local event index, without a browser.
+
+        Args:
+            query: Free-text query
+            max_events: Maximum number of events to return
+
+        Returns:
+            list: Event dicts with their BM25 score, best match first
+        """
+        self.queries += 1
+        return [dict(event, score=round(score, 3)) for score, event in self.index.search(query, limit=max_events)]
+
+    def status(self):
+        """Return a small health report."""
+        return {
+            "status": "ok",
+            "queries": self.queries,
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "hosts": RATE_LIMITER.stats(),
+        }
+
+    def close(self):
+        """Shut down all browser sessions and resources."""
+        if self.cache:
+            self.cache.close()
+        self.index.close()
+        if self.http_session:
+            self.http_session.close()
+        self.search_pool.close()
+        self.detail_pool.close()
+
+class DaemonRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler exposing /search, /query, /health and /metrics."""
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        params = parse_qs(parsed.query)
+        scraper = self.server.scraper
+
+        if parsed.path == '/health':
+            self._send_json(200, scraper.status())
+            return
+
+        if parsed.path == '/metrics':
+            body = METRICS.to_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        if parsed.path == '/query':
+            query = params.get('q', [''])[0].strip()
+            if not query:
+                self._send_json(400, {"error": "Missing q parameter"})
+                return
+            try:
+                max_events = int(params.get('max_events', [scraper.args.max_events])[0])
+            except ValueError:
+                self._send_json(400, {"error": "max_events must be an integer"})
+                return
+            start = time.monotonic()
+            events = scraper.query(query, max_events)
+            self._send_json(200, {
+                "query": query,
+                "events": events,
+                "elapsed_seconds": round(time.monotonic() - start, 4),
+            })
+            return
+
+        if parsed.path != '/search':
+            self._send_json(404, {"error": f"Unknown endpoint: {parsed.path}"})
+            return
+
+        keywords = params.get('keywords', [''])[0].strip()
+        if not keywords:
+            self._send_json(400, {"error": "Missing keywords parameter"})
+            return
+        try:
+            max_events = int(params.get('max_events', [scraper.args.max_events])[0])
+        except ValueError:
+            self._send_json(400, {"error": "max_events must be an integer"})
+            return
+
+        start = time.monotonic()
+        try:
+            events = scraper.search(keywords, max_events)
+        except Exception as e:
+            logger.error(f"Query failed for '{keywords}': {str(e)}")
+            self._send_json(500, {"error": str(e)})
+            return
+
+        elapsed = time.monotonic() - start
+        logger.info(f"Answered query '{keywords}' with {len(events)} events in {elapsed:.2f}s")
+        self._send_json(200, {
+            "keywords": keywords,
+            "events": events,
+            "elapsed_seconds": round(elapsed, 3),
+        })
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.info(f"{self.address_string()} - {format % args}")
+
+def main():
+    """Run the scraper daemon until interrupted."""
+    args = parse_arguments()
+    scraper = ScraperDaemon(args)
+    server = None
+
+    try:
+        scraper.warm_up()
+        server = ThreadingHTTPServer((args.host, args.port), DaemonRequestHandler)
+        server.scraper = scraper
+        logger.info(f"Scraper daemon listening on http://{args.host}:{args.port}")
+        server.serve_forever()
+        return 0
+    except KeyboardInterrupt:
+        logger.info("Shutting down scraper daemon")
+        return 0
+    except Exception as e:
+        logger.error(f"Scraper daemon failed: {str(e)}")
+        return 1
+    finally:
+        if server:
+            server.server_close()
+        scraper.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
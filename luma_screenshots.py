@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Background screenshot writer for the Luma scrapers.
+
+Capturing a screenshot only grabs the PNG bytes from the browser; encoding,
+optional downscaling and writing happen on a writer thread, so debug
+captures stay off the page's hot path. Screenshots go to a per-run
+directory and stop once a count or size budget is used up. In failure mode
+only error snapshots are kept, and the other captures are skipped before
+the browser is even asked for an image.
+
+Downscaling and JPEG/WebP output need Pillow; plain PNGs do not.
+
+Usage:
+    from luma_screenshots import SCREENSHOTS
+    SCREENSHOTS.configure("screenshots/run_20250401_120000", image_format="jpeg", max_width=960)
+    if SCREENSHOTS.wants():
+        SCREENSHOTS.submit("search_results", driver.get_screenshot_as_png())
+    SCREENSHOTS.close()
+"""
+
+import io
+import os
+import queue
+import logging
+import threading
+
+from luma_metrics import METRICS
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+IMAGE_FORMATS = {"png": "PNG", "jpeg": "JPEG", "webp": "WEBP"}
+
+SCREENSHOT_MODES = ("all", "failures")
+
+class ScreenshotWriter:
+    """
+    Queue of screenshots written to disk by a background thread.
+
+    Disabled until configure() is called. Submitting never blocks: when the
+    queue is full or the budget is used up, the screenshot is dropped and
+    counted instead. Thread-safe; share one instance per process.
+    """
+
+    def __init__(self):
+        self._thread = None
+        self._lock = threading.Lock()
+        self._reset(None)
+
+    def _reset(self, directory, image_format="png", max_width=0, quality=80, failures_only=False,
+               max_count=200, max_bytes=100 * 1024 * 1024, prefix="", queue_size=32):
+        self.directory = directory
+        self.image_format = image_format
+        self.max_width = max_width
+        self.quality = quality
+        self.failures_only = failures_only
+        self.max_count = max_count
+        self.max_bytes = max_bytes
+        self.prefix = prefix
+        self.saved = 0
+        self.bytes_written = 0
+        self.dropped = 0
+        self._accepted = 0
+        self._queue = queue.Queue(maxsize=max(1, queue_size))
+
+    def configure(self, directory, image_format="png", max_width=0, quality=80, failures_only=False,
+                  max_count=200, max_bytes=100 * 1024 * 1024, prefix="", queue_size=32):
+        """
+        Enable the writer; finishes any screenshots still queued under the previous settings.
+
+        Args:
+            directory: Directory the screenshots are written to; created on first write
+            image_format: "png", "jpeg" or "webp"
+            max_width: Downscale wider screenshots to this width; 0 keeps the full size
+            quality: JPEG/WebP quality
+            failures_only: Only keep screenshots submitted as failures
+            max_count: Maximum number of screenshots per run
+            max_bytes: Maximum total size of the written screenshots
+            prefix: Prefix of every file name, e.g. to tell worker processes apart
+            queue_size: Screenshots waiting to be written before new ones are dropped
+        """
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unknown screenshot format: {image_format}")
+        if Image is None and (image_format != "png" or max_width):
+            raise RuntimeError("Downscaled or JPEG/WebP screenshots require Pillow (pip install Pillow)")
+        self.close()
+        with self._lock:
+            self._reset(directory, image_format, max_width, quality, failures_only, max_count, max_bytes,
+                        prefix, queue_size)
+
+    @property
+    def enabled(self):
+        return self.directory is not None
+
+    def wants(self, failure=False):
+        """
+        Check whether a screenshot would be kept, before capturing it.
+
+        Args:
+            failure: Whether the screenshot documents an error
+
+        Returns:
+            bool: False if the writer is disabled, the mode skips this kind of
+                  screenshot, or the count budget is used up
+        """
+        with self._lock:
+            return (self.enabled and (failure or not self.failures_only)
+                    and self._accepted < self.max_count and self.bytes_written < self.max_bytes)
+
+    def submit(self, name, png, failure=False):
+        """
+        Queue a screenshot for writing.
+
+        Args:
+            name: File name without extension
+            png: PNG bytes as returned by driver.get_screenshot_as_png()
+            failure: Whether the screenshot documents an error
+
+        Returns:
+            bool: True if the screenshot was queued
+        """
+        if not self.wants(failure):
+            self._drop()
+            return False
+
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+                self._thread.start()
+            # Numbered and counted against the budget only once actually queued
+            try:
+                self._queue.put_nowait((f"{self.prefix}{self._accepted + 1:04d}_{name}", png))
+            except queue.Full:
+                full = True
+            else:
+                full = False
+                self._accepted += 1
+        if full:
+            logger.info(f"Screenshot queue full, dropping {name}")
+            self._drop()
+            return False
+        return True
+
+    def _drop(self):
+        with self._lock:
+            self.dropped += 1
+        METRICS.increment("screenshots_dropped")
+
+    def _encode(self, png):
+        """Return the bytes to write and their file extension."""
+        if Image is None or (self.image_format == "png" and not self.max_width):
+            return png, "png"
+
+        image = Image.open(io.BytesIO(png))
+        if self.max_width and image.width > self.max_width:
+            height = max(1, round(image.height * self.max_width / image.width))
+            image = image.resize((self.max_width, height), Image.LANCZOS)
+        if self.image_format == "jpeg" and image.mode != "RGB":
+            image = image.convert("RGB")
+
+        output = io.BytesIO()
+        options = {"optimize": True} if self.image_format == "png" else {"quality": self.quality}
+        image.save(output, format=IMAGE_FORMATS[self.image_format], **options)
+        return output.getvalue(), "jpg" if self.image_format == "jpeg" else self.image_format
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            name, png = item
+            try:
+                with METRICS.span("screenshot.encode"):
+                    data, extension = self._encode(png)
+                with self._lock:
+                    over_budget = self.bytes_written + len(data) > self.max_bytes
+                    if not over_budget:
+                        self.bytes_written += len(data)
+                if over_budget:
+                    logger.info(f"Screenshot size budget used up, dropping {name}")
+                    self._drop()
+                    continue
+                os.makedirs(self.directory, exist_ok=True)
+                path = os.path.join(self.directory, f"{name}.{extension}")
+                with METRICS.span("screenshot.write"), open(path, "wb") as f:
+                    f.write(data)
+                with self._lock:
+                    self.saved += 1
+                METRICS.increment("screenshots_saved")
+                METRICS.increment("screenshot_bytes", len(data))
+                logger.info(f"Screenshot saved: {path}")
+            except Exception as e:
+                logger.error(f"Error writing screenshot {name}: {str(e)}")
+
+    def stats(self):
+        """
+        Return how many screenshots were saved and dropped.
+
+        Returns:
+            dict: saved, dropped, bytes_written and the output directory
+        """
+        with self._lock:
+            return {"saved": self.saved, "dropped": self.dropped, "bytes_written": self.bytes_written,
+                    "directory": self.directory}
+
+    def close(self):
+        """Write the queued screenshots and stop the writer thread. Safe to call twice."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join()
+        stats = self.stats()
+        logger.info(f"Saved {stats['saved']} screenshots ({stats['bytes_written'] / 1024 / 1024:.1f} MB) "
+                    f"to {stats['directory']}; {stats['dropped']} dropped")
+
+# Shared by all modules of one process; configured from the command line in main()
+SCREENSHOTS = ScreenshotWriter()
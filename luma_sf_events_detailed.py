@@ -7,7 +7,20 @@ by clicking into each event page. It captures event title, speakers, summary, an
 
 Usage:
     python luma_sf_events_detailed.py --keywords "AI"
-    python luma_sf_events_detailed.py --keywords "founder,startup,tech" --max-events 20
+    python luma_sf_events_detailed.py --keywords "founder,startup,tech" --max-events 20 --workers 3
+    python luma_sf_events_detailed.py --keywords "AI" --max-events 30 --workers 4
+    python luma_sf_events_detailed.py --keywords "AI" --max-events 30 --workers 4 --rate-limit 4 --max-host-concurrency 4
+    python luma_sf_events_detailed.py --keywords "AI" --max-events 300 --max-scrolls 100
+    python luma_sf_events_detailed.py --keywords "AI" --fetch-mode http
+    python luma_sf_events_detailed.py --keywords "AI" --extraction-mode script --lean
+    python luma_sf_events_detailed.py --keywords "AI" --refresh
+    python luma_sf_events_detailed.py --keywords "AI,startup" --cities sf,nyc,la --format jsonl
+    python luma_sf_events_detailed.py --keywords "AI" --format jsonl --write-mode merge --output sf_events.jsonl
+    python luma_sf_events_detailed.py --keywords "AI" --metrics-prometheus /var/lib/node_exporter/luma.prom
+    python luma_sf_events_detailed.py --keywords "AI" --base-url http://127.0.0.1:8766
+    python luma_sf_events_detailed.py --event-urls "http://127.0.0.1:8000/e/evt-test" --fetch-mode http
+    python luma_sf_events_detailed.py --query "AI agents" --max-events 20
+    python luma_sf_events_detailed.py --query "AI agents" --refresh
 """
 
 import os
@@ -17,6 +30,23 @@ import logging
 import argparse
 import datetime
 import re
+import queue
+import signal
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from luma_http_fetch import (
+    create_http_session, fetch_event_page, is_event_complete, merge_structured_event, NOT_MODIFIED,
+)
+from luma_event_cache import EventCache, DEFAULT_CACHE_PATH
+from luma_output_writers import create_writer, FILE_EXTENSIONS, WRITE_MODES
+from luma_structured_data import parse_structured_event, MAX_SUMMARY_LENGTH, ERROR_TITLE
+from luma_rate_limiter import HostRateLimiter
+from luma_metrics import METRICS
+from luma_screenshots import SCREENSHOTS, IMAGE_FORMATS, SCREENSHOT_MODES
+from luma_dedupe import NearDuplicateIndex, DEFAULT_DEDUPE_PATH, DEDUPE_MODES
+from luma_event_index import EventIndex, DEFAULT_INDEX_PATH
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
@@ -41,88 +71,482 @@ def parse_arguments():
     parser = argparse.ArgumentParser(description='Luma SF Events Detailed Scraper')
     
     # Search parameters
-    parser.add_argument('--keywords', required=True, help='Comma-separated keywords to search for events (e.g., "AI,tech,startup")')
+    parser.add_argument('--keywords', help='Comma-separated keywords, each searched as its own query (e.g., "AI,tech,startup")')
+    parser.add_argument('--query', help='Answer a keyword query from the local event index; Luma is only searched when no indexed event matches, or with --refresh')
+    parser.add_argument('--cities', help='Comma-separated Luma city slugs to crawl in parallel worker processes (e.g., "sf,nyc,la"); results are tagged by city')
+    parser.add_argument('--processes', type=int, help='Number of worker processes for --cities (default: one per city, up to the CPU count)')
+    parser.add_argument('--base-url', default=LUMA_BASE_URL, help=f'Site root for city pages and searches, e.g. a local replay server (default: {LUMA_BASE_URL})')
+    parser.add_argument('--event-urls', help='Comma-separated event URLs to extract directly, skipping search (e.g., for a local fixture server)')
     parser.add_argument('--max-events', type=int, default=10, help='Maximum number of events to discover (default: 10)')
-    parser.add_argument('--wait-time', type=int, default=5, help='Wait time in seconds for page loading (default: 5)')
+    parser.add_argument('--max-scrolls', type=int, default=DEFAULT_MAX_SCROLLS,
+                        help=f'Scroll steps used to load more results when the first screen has too few events; 0 disables scrolling (default: {DEFAULT_MAX_SCROLLS})')
+    parser.add_argument('--wait-time', type=int, default=5, help='Maximum wait time in seconds for page loading (default: 5)')
     
     # Browser parameters
     parser.add_argument('--headless', action='store_true', help='Run browser in headless mode')
-    parser.add_argument('--screenshots', action='store_true', help='Save screenshots during execution')
+    parser.add_argument('--screenshots', action='store_true', help='Save screenshots during execution, written in the background to a per-run directory')
+    parser.add_argument('--screenshot-dir', default='screenshots', help='Directory receiving one subdirectory of screenshots per run (default: screenshots)')
+    parser.add_argument('--screenshot-mode', choices=SCREENSHOT_MODES, default='all',
+                        help='Save every screenshot, or only those taken on errors; "failures" implies --screenshots (default: all)')
+    parser.add_argument('--screenshot-format', choices=sorted(IMAGE_FORMATS), default='png', help='Screenshot image format; jpeg and webp need Pillow (default: png)')
+    parser.add_argument('--screenshot-max-width', type=int, default=0, help='Downscale screenshots to this width in pixels, needs Pillow; 0 keeps the full size (default: 0)')
+    parser.add_argument('--screenshot-max-count', type=int, default=200, help='Maximum number of screenshots per run (default: 200)')
+    parser.add_argument('--screenshot-max-mb', type=float, default=100, help='Maximum total size of the screenshots of a run in MB (default: 100)')
     parser.add_argument('--chromedriver-path', help='Path to chromedriver executable (optional)')
+    parser.add_argument('--lean', action='store_true',
+                        help='Lean browser profile: eager page loads, no images/media/fonts/trackers, fewer Chrome background features')
+    parser.add_argument('--workers', type=int, default=1, help='Number of browser sessions used to extract event details in parallel (default: 1)')
+    parser.add_argument('--rate-limit', type=float, default=2.0,
+                        help='Maximum page loads per second per host; lowered automatically when the site throttles (default: 2.0)')
+    parser.add_argument('--max-host-concurrency', type=int, default=4, help='Maximum concurrent page loads per host (default: 4)')
+    parser.add_argument('--fetch-mode', choices=['browser', 'http'], default='browser',
+                        help='How to load event pages: full browser, or HTTP with browser fallback (default: browser)')
+    parser.add_argument('--extraction-mode', choices=['dom', 'script'], default='dom',
+                        help='How to read pages in the browser: per-element queries, or one batched in-page script (default: dom)')
+    
+    # Cache parameters
+    parser.add_argument('--cache-path', default=DEFAULT_CACHE_PATH, help=f'Event detail cache database (default: {DEFAULT_CACHE_PATH})')
+    parser.add_argument('--cache-ttl', type=float, default=24, help='Hours a cached event is reused before it is refetched; 0 disables the cache (default: 24)')
+    parser.add_argument('--cache-max-entries', type=int, default=5000, help='Maximum number of cached events before the least recently used are evicted (default: 5000)')
+    parser.add_argument('--refresh', action='store_true', help='Ignore cached and indexed events: refetch every event page, and search Luma live for --query')
+    
+    # Dedupe parameters
+    parser.add_argument('--dedupe', choices=DEDUPE_MODES, default='off',
+                        help='Near-duplicate events listed under several URLs: keep all, drop repeats, or keep all tagged with a cluster_id (default: off)')
+    parser.add_argument('--dedupe-path', default=DEFAULT_DEDUPE_PATH, help=f'Near-duplicate index database, kept between runs (default: {DEFAULT_DEDUPE_PATH})')
+    parser.add_argument('--dedupe-threshold', type=float, default=0.8,
+                        help='Estimated similarity of title, hosts and summary from which events count as duplicates (default: 0.8)')
+    
+    # Index parameters
+    parser.add_argument('--index-path', default=DEFAULT_INDEX_PATH, help=f'Full-text index every written event is added to (default: {DEFAULT_INDEX_PATH})')
+    parser.add_argument('--no-index', action='store_true', help='Do not add events to the full-text index')
+    parser.add_argument('--query-max-age', type=float, default=0,
+                        help='With --query, only answer from events indexed within this many hours; 0 accepts any age (default: 0)')
     
     # Output parameters
-    parser.add_argument('--output', help='Output file to save discovered events (default: sf_events_detailed.txt)')
+    parser.add_argument('--output', help='Output file to save discovered events (default: sf_events_detailed_<keywords>.<format extension>)')
+    parser.add_argument('--format', choices=sorted(FILE_EXTENSIONS), default='text', help='Output format (default: text)')
+    parser.add_argument('--write-mode', choices=WRITE_MODES, default='overwrite',
+                        help='Replace the output file, append to it, or merge by event URL (default: overwrite)')
+    parser.add_argument('--metrics-json', help='JSON report of phase timings and counters (default: <output>.metrics.json)')
+    parser.add_argument('--metrics-prometheus', help='Also write the run metrics in Prometheus text format to this file')
+    
+    args = parser.parse_args()
+    if not args.keywords and not args.event_urls and not args.query:
+        parser.error('one of --keywords, --event-urls or --query is required')
+    if args.query:
+        if args.no_index:
+            parser.error('--query cannot be used with --no-index')
+        # Searched on Luma when the index has no answer
+        args.keywords = args.keywords or args.query
+    if args.cities and not args.keywords:
+        parser.error('--cities requires --keywords')
+    if args.screenshot_mode == 'failures':
+        args.screenshots = True
+    if args.format == 'text' and args.write_mode == 'merge':
+        parser.error('--write-mode merge requires a machine-readable --format')
+    return args
+
+# Readiness checks run inside the page, so they are unaffected by implicit waits
+EVENT_ANCHOR_SELECTOR = "a[href*='/e/'], a[href*='/events/']"
+
+READINESS_POLL_INTERVAL = 0.1
+
+SF_PAGE_READY_SCRIPT = """
+if (document.readyState === 'loading') { return false; }
+return !!document.querySelector(
+    "button[aria-label*='search' i], input[placeholder*='search' i], input[aria-label*='search' i], "
+    + arguments[0]);
+"""
+
+EVENT_ANCHORS_SCRIPT = """
+var anchors = document.querySelectorAll(arguments[0]);
+var hrefs = [];
+for (var i = 0; i < anchors.length && i < 20; i++) { hrefs.push(anchors[i].href); }
+return [window.location.href, anchors.length, hrefs.join('|')];
+"""
+
+EVENT_PAGE_READY_SCRIPT = """
+if (document.querySelector("script[type='application/ld+json'], script#__NEXT_DATA__")) { return true; }
+return !!document.querySelector('h1')
+    && !!document.querySelector("[class*='host'], [class*='speaker']");
+"""
+
+def city_page_ready(driver):
+    """Readiness predicate: city page has loaded and shows a search control or event list."""
+    return bool(driver.execute_script(SF_PAGE_READY_SCRIPT, EVENT_ANCHOR_SELECTOR))
+
+def event_page_ready(driver):
+    """Readiness predicate: event page has structured data, or a heading and a host block."""
+    return bool(driver.execute_script(EVENT_PAGE_READY_SCRIPT))
+
+def event_anchor_state(driver):
+    """
+    Snapshot the current URL and the event anchors on the page.
+    
+    Returns:
+        tuple: (current URL, number of event anchors, signature of the first anchors)
+    """
+    url, count, signature = driver.execute_script(EVENT_ANCHORS_SCRIPT, EVENT_ANCHOR_SELECTOR)
+    return url, count, signature
+
+def search_results_ready(previous_state=None):
+    """
+    Build a readiness predicate for search results.
+    
+    Args:
+        previous_state: Optional event_anchor_state() taken before the search was
+                        submitted. If given, the results only count as ready once
+                        the URL or the listed events have changed.
+        
+    Returns:
+        callable: Predicate returning True once at least one event anchor is shown
+    """
+    def predicate(driver):
+        state = event_anchor_state(driver)
+        if state[1] < 1:
+            return False
+        if previous_state is None:
+            return True
+        return state[0] != previous_state[0] or state[2] != previous_state[2]
+    return predicate
+
+def wait_until_ready(driver, name, predicate, timeout):
+    """
+    Wait until a page readiness predicate holds, up to a hard timeout.
+    
+    Args:
+        driver: WebDriver instance
+        name: Name of the wait, used for logging and timing statistics
+        predicate: Callable taking the driver and returning True when the page is ready
+        timeout: Maximum time to wait in seconds
+        
+    Returns:
+        bool: True if the page became ready, False if the timeout was reached
+    """
+    def check(driver):
+        try:
+            return predicate(driver)
+        except WebDriverException:
+            # The page may be mid-navigation; treat as not ready yet
+            return False
+    
+    start = time.monotonic()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=READINESS_POLL_INTERVAL).until(check)
+        ready = True
+    except TimeoutException:
+        ready = False
+    elapsed = time.monotonic() - start
+    
+    METRICS.record_span(f"wait.{name}", elapsed)
+    if not ready:
+        METRICS.increment("wait_timeouts")
+    
+    if ready:
+        logger.info(f"Page ready ({name}) after {elapsed:.2f}s")
+    else:
+        logger.info(f"Page not ready ({name}) after {elapsed:.2f}s timeout, continuing")
+    return ready
+
+class SelectorPlan:
+    """
+    Ordered fallback selectors for one kind of element on one page type.
+    
+    The plan remembers which strategy last found elements and tries it first
+    next time. Sessions run with a zero implicit wait, so a strategy that
+    matches nothing costs a single round trip instead of a full timeout.
+    """
+    
+    def __init__(self, name, strategies):
+        """
+        Args:
+            name: Page type and element kind, e.g. "event_page.speakers"
+            strategies: List of (label, By locator, selector) tuples in default order
+        """
+        self.name = name
+        self.strategies = strategies
+        self.hits = {label: 0 for label, _, _ in strategies}
+        self.switches = 0
+        self._preferred = strategies[0][0]
+        self._lock = threading.Lock()
+    
+    def ordered_strategies(self):
+        """Return the strategies with the last successful one first."""
+        with self._lock:
+            preferred = self._preferred
+        return sorted(self.strategies, key=lambda strategy: strategy[0] != preferred)
+    
+    def record_success(self, label):
+        """Remember that a strategy found elements."""
+        with self._lock:
+            self.hits[label] += 1
+            if label != self.strategies[0][0]:
+                METRICS.increment("selector_fallbacks")
+            if label != self._preferred:
+                logger.info(f"Selector plan {self.name}: switching to strategy '{label}'")
+                METRICS.increment("selector_strategy_switches")
+                self.switches += 1
+                self._preferred = label
+    
+    def iter_matches(self, context):
+        """
+        Yield (label, elements) for each strategy in preferred order.
+        
+        Callers that need results from several strategies can keep iterating;
+        they should call record_success() for the strategy they used.
+        """
+        for label, by, selector in self.ordered_strategies():
+            yield label, context.find_elements(by, selector)
+    
+    def find(self, context):
+        """
+        Return the elements of the first strategy that matches anything.
+        
+        Args:
+            context: WebDriver or WebElement to search in
+            
+        Returns:
+            tuple: (strategy label or None, list of elements)
+        """
+        for label, elements in self.iter_matches(context):
+            if elements:
+                self.record_success(label)
+                return label, elements
+        return None, []
+
+SEARCH_INPUT_XPATH = "//input[contains(@placeholder, 'search') or contains(@placeholder, 'Search') or contains(@aria-label, 'search')]"
+
+SEARCH_CONTROL_PLAN = SelectorPlan("city_page.search_control", [
+    ("button_aria_label", By.XPATH, "//button[contains(@aria-label, 'search') or contains(@aria-label, 'Search')]"),
+    ("button_icon", By.XPATH, "//button[contains(@class, 'search') or .//i[contains(@class, 'search')]]"),
+    ("button_svg", By.XPATH, "//button[.//svg[contains(@class, 'search')]]"),
+    ("button_text", By.XPATH, "//button[contains(text(), 'Search') or .//span[contains(text(), 'Search')]]"),
+    ("search_input", By.XPATH, SEARCH_INPUT_XPATH),
+])
+
+EVENT_LINK_PLAN = SelectorPlan("search_results.event_links", [
+    ("event_cards", By.XPATH, "//div[contains(@class, 'event-card') or contains(@class, 'event-item')]//a"),
+    ("direct_links", By.XPATH, "//a[contains(@href, '/events/') or contains(@href, '/e/')]"),
+    ("all_links", By.TAG_NAME, "a"),
+])
+
+SPEAKER_PLAN = SelectorPlan("event_page.speakers", [
+    ("host_class", By.XPATH, "//div[contains(@class, 'speaker') or contains(@class, 'host')]"),
+    ("host_label", By.XPATH, "//div[contains(text(), 'Speaker') or contains(text(), 'Host')]/following-sibling::div"),
+    ("avatar", By.XPATH, "//img[contains(@alt, 'profile') or contains(@class, 'avatar')]/parent::div/parent::div"),
+])
+
+SUMMARY_PLAN = SelectorPlan("event_page.summary", [
+    ("description_class", By.XPATH, "//div[contains(@class, 'description') or contains(@class, 'summary')]"),
+    ("about_label", By.XPATH, "//div[contains(text(), 'About') or contains(text(), 'Description')]/following-sibling::div"),
+    ("main_paragraphs", By.XPATH, "//main//p"),
+])
+
+SELECTOR_PLANS = [SEARCH_CONTROL_PLAN, EVENT_LINK_PLAN, SPEAKER_PLAN, SUMMARY_PLAN]
+
+def log_selector_plans():
+    """Log which selector strategies were used and how often a fallback was needed."""
+    for plan in SELECTOR_PLANS:
+        if any(plan.hits.values()):
+            hits = ", ".join(f"{label}={count}" for label, count in plan.hits.items() if count)
+            logger.info(f"Selector plan {plan.name}: {hits}; {plan.switches} strategy switches")
+
+# Shared by every page load, browser and HTTP; configured from the
+# command line in main()
+RATE_LIMITER = HostRateLimiter()
+
+def configure_rate_limiter(args):
+    """Apply the --rate-limit and --max-host-concurrency options to the shared rate limiter."""
+    RATE_LIMITER.configure(rate=args.rate_limit, max_concurrency=args.max_host_concurrency)
+
+def configure_screenshots(args, prefix=""):
+    """Point the shared screenshot writer at the run's directory with the --screenshot-* options."""
+    SCREENSHOTS.configure(args.screenshot_run_dir, image_format=args.screenshot_format,
+                          max_width=args.screenshot_max_width, failures_only=args.screenshot_mode == 'failures',
+                          max_count=args.screenshot_max_count, max_bytes=int(args.screenshot_max_mb * 1024 * 1024),
+                          prefix=prefix)
+
+def capture_screenshot(driver, name, failure=False):
+    """
+    Grab a screenshot and hand it to the background writer.
+    
+    Only the capture itself runs on the calling thread; screenshots the writer
+    would not keep (failure-only mode, budget used up) are not captured at all.
+    
+    Args:
+        driver: WebDriver instance
+        name: File name without extension
+        failure: Whether the screenshot documents an error
+    """
+    if not SCREENSHOTS.wants(failure):
+        return
+    try:
+        with METRICS.span("screenshot.capture"):
+            png = driver.get_screenshot_as_png()
+    except WebDriverException as e:
+        logger.error(f"Could not capture screenshot {name}: {str(e)}")
+        return
+    SCREENSHOTS.submit(name, png, failure)
+
+# Title/heading fragments of rate limit and bot-protection pages
+THROTTLED_PAGE_PATTERNS = [
+    "too many requests", "rate limit", "429", "access denied",
+    "temporarily blocked", "just a moment", "attention required",
+]
+
+THROTTLED_PAGE_SCRIPT = """
+var heading = document.querySelector('h1');
+return (document.title + ' ' + (heading ? heading.innerText : '')).toLowerCase();
+"""
+
+def is_throttled_page(driver, ready=None):
+    """
+    Check whether the current page is a rate limit or block page instead of content.
+    
+    The patterns are also matched against the ``h1``, which on an event page
+    is the event title ("Rate Limiting at Scale"), so a page that passes its
+    readiness predicate is never treated as a block page.
+    
+    Args:
+        driver: WebDriver instance
+        ready: Readiness predicate of the expected page, or None
+    
+    Returns:
+        bool: True if the title or heading looks like a block page and the
+              expected content is missing
+    """
+    try:
+        text = driver.execute_script(THROTTLED_PAGE_SCRIPT) or ""
+        if not any(pattern in text for pattern in THROTTLED_PAGE_PATTERNS):
+            return False
+        return ready is None or not ready(driver)
+    except WebDriverException:
+        return False
+
+def load_page(driver, url, span_name="page.navigate", ready=None):
+    """
+    Load a page in the browser once the rate limiter allows it.
+    
+    Slow loads and rate limit pages are reported back to the limiter, which
+    then lowers the request rate for the host.
+    
+    Args:
+        driver: WebDriver instance
+        url: URL to load
+        span_name: Name of the timing span the navigation is recorded under
+        ready: Readiness predicate of the expected page; a page passing it is
+               never reported as a block page
+    
+    Returns:
+        bool: False if the site answered with a rate limit or block page
+    """
+    with RATE_LIMITER.request(url) as slot:
+        with METRICS.span(span_name):
+            driver.get(url)
+        METRICS.increment("pages_fetched")
+        throttled = is_throttled_page(driver, ready)
+        slot.report(throttled=throttled)
+    
+    if throttled:
+        METRICS.increment("throttled_pages")
+        logger.error(f"Rate limit or block page returned for {url}")
+    return not throttled
+
+LUMA_BASE_URL = "https://lu.ma"
+
+def set_base_url(base_url):
+    """Point city pages and search URLs at another site root, e.g. a local replay server."""
+    global LUMA_BASE_URL
+    LUMA_BASE_URL = base_url.rstrip('/')
+
+DEFAULT_CITY = "sf"
+
+def city_page_url(city=DEFAULT_CITY):
+    """Return the Luma discovery page of a city, e.g. https://lu.ma/sf."""
+    return f"{LUMA_BASE_URL}/{city}"
+
+def open_city_page(driver, wait_time=5, take_screenshots=False, city=DEFAULT_CITY):
+    """
+    Navigate to a Luma city page and wait until it is ready for searching.
+    
+    Args:
+        driver: WebDriver instance
+        wait_time: Time to wait for page loading in seconds
+        take_screenshots: Whether to save screenshots
+        city: Luma city slug, e.g. "sf" or "nyc"
+        
+    Returns:
+        bool: True if the page became ready within wait_time
+    """
+    logger.info(f"Navigating to Luma {city} page")
+    load_page(driver, city_page_url(city), span_name="search.navigate", ready=city_page_ready)
+    ready = wait_until_ready(driver, "city_page", city_page_ready, wait_time)
     
-    return parser.parse_args()
+    if take_screenshots:
+        capture_screenshot(driver, f"{city}_page")
+    return ready
 
-def search_for_events(driver, keywords, wait_time=5, take_screenshots=False):
+def is_on_city_page(driver, city=DEFAULT_CITY):
+    """Check whether the session is already sitting on a city page."""
+    try:
+        return driver.current_url.rstrip('/') == city_page_url(city)
+    except WebDriverException:
+        return False
+
+@METRICS.timed("search.total")
+def search_for_events(driver, keywords, wait_time=5, take_screenshots=False, reuse_page=False, city=DEFAULT_CITY):
     """
-    Search for events using Luma's search functionality on the SF page.
+    Search for events using Luma's search functionality on a city page.
     
     Args:
         driver: WebDriver instance
         keywords: Keywords to search for
         wait_time: Time to wait for page loading in seconds
         take_screenshots: Whether to save screenshots
+        reuse_page: Skip navigation if the session is already on the city page
+        city: Luma city slug, e.g. "sf" or "nyc"
         
     Returns:
         bool: True if search successful, False otherwise
     """
     try:
-        # Navigate directly to Luma SF page
-        logger.info("Navigating to Luma SF page")
-        driver.get("https://lu.ma/sf")
-        time.sleep(wait_time)
-        
-        if take_screenshots:
-            driver.save_screenshot("sf_page.png")
-            logger.info("Screenshot saved: sf_page.png")
+        # Navigate directly to the Luma city page, unless a warm session is already there
+        if reuse_page and is_on_city_page(driver, city):
+            logger.info(f"Reusing warm Luma {city} page")
+        else:
+            open_city_page(driver, wait_time, take_screenshots, city=city)
         
-        # Look for search button/icon
+        # Look for search button/icon, or the search input directly
         logger.info("Looking for search button")
         search_buttons = []
         
-        # Try different approaches to find the search button
         try:
-            # Try to find by aria-label
-            search_buttons = driver.find_elements(By.XPATH, "//button[contains(@aria-label, 'search') or contains(@aria-label, 'Search')]")
+            with METRICS.span("search.find_control"):
+                strategy, search_controls = SEARCH_CONTROL_PLAN.find(driver)
             
-            if not search_buttons:
-                # Try to find by icon
-                search_buttons = driver.find_elements(By.XPATH, "//button[contains(@class, 'search') or .//i[contains(@class, 'search')]]")
+            if strategy == "search_input":
+                logger.info("Found search input directly")
+                search_input = search_controls[0]
+                search_input.click()
+                
+                if take_screenshots:
+                    capture_screenshot(driver, "search_input_clicked")
                 
-            if not search_buttons:
-                # Try to find by SVG icon
-                search_buttons = driver.find_elements(By.XPATH, "//button[.//svg[contains(@class, 'search')]]")
+                # Enter search keywords
+                search_input.clear()
+                search_input.send_keys(keywords)
+                previous_state = event_anchor_state(driver)
+                search_input.send_keys(Keys.ENTER)
+                logger.info(f"Entered search keywords: {keywords}")
                 
-            if not search_buttons:
-                # Try to find by text content
-                search_buttons = driver.find_elements(By.XPATH, "//button[contains(text(), 'Search') or .//span[contains(text(), 'Search')]]")
+                if take_screenshots:
+                    capture_screenshot(driver, "search_submitted")
                 
-            if not search_buttons:
-                # Try to find search input directly
-                search_inputs = driver.find_elements(By.XPATH, "//input[contains(@placeholder, 'search') or contains(@placeholder, 'Search') or contains(@aria-label, 'search')]")
-                if search_inputs:
-                    logger.info("Found search input directly")
-                    search_input = search_inputs[0]
-                    search_input.click()
-                    time.sleep(1)
-                    
-                    if take_screenshots:
-                        driver.save_screenshot("search_input_clicked.png")
-                    
-                    # Enter search keywords
-                    search_input.clear()
-                    search_input.send_keys(keywords)
-                    time.sleep(1)
-                    search_input.send_keys(Keys.ENTER)
-                    logger.info(f"Entered search keywords: {keywords}")
-                    
-                    if take_screenshots:
-                        driver.save_screenshot("search_submitted.png")
-                    
-                    time.sleep(wait_time)
-                    return True
+                wait_until_ready(driver, "search_results", search_results_ready(previous_state), wait_time)
+                return True
+            
+            search_buttons = search_controls
         except Exception as e:
             logger.error(f"Error finding search button: {str(e)}")
         
@@ -133,35 +557,34 @@ def search_for_events(driver, keywords, wait_time=5, take_screenshots=False):
             # Click the first search button
             search_buttons[0].click()
             logger.info("Clicked search button")
-            time.sleep(1)
             
             if take_screenshots:
-                driver.save_screenshot("search_button_clicked.png")
+                capture_screenshot(driver, "search_button_clicked")
             
             # Now look for the search input field
             try:
-                search_input = WebDriverWait(driver, wait_time).until(
-                    EC.presence_of_element_located((By.XPATH, "//input[contains(@placeholder, 'search') or contains(@placeholder, 'Search') or contains(@aria-label, 'search')]"))
+                search_input = WebDriverWait(driver, wait_time, poll_frequency=READINESS_POLL_INTERVAL).until(
+                    EC.presence_of_element_located((By.XPATH, SEARCH_INPUT_XPATH))
                 )
                 
                 # Enter search keywords
                 search_input.clear()
                 search_input.send_keys(keywords)
-                time.sleep(1)
+                previous_state = event_anchor_state(driver)
                 search_input.send_keys(Keys.ENTER)
                 logger.info(f"Entered search keywords: {keywords}")
                 
                 if take_screenshots:
-                    driver.save_screenshot("search_submitted.png")
+                    capture_screenshot(driver, "search_submitted")
                 
-                time.sleep(wait_time)
+                wait_until_ready(driver, "search_results", search_results_ready(previous_state), wait_time)
                 return True
                 
             except TimeoutException:
                 logger.error("Could not find search input field after clicking search button")
                 
                 if take_screenshots:
-                    driver.save_screenshot("search_input_not_found.png")
+                    capture_screenshot(driver, "search_input_not_found", failure=True)
                 
                 return False
         
@@ -171,125 +594,487 @@ def search_for_events(driver, keywords, wait_time=5, take_screenshots=False):
         # Format keywords for URL
         url_keywords = keywords.replace(',', '+').replace(' ', '+')
         
-        # Navigate to search URL with SF filter
-        search_url = f"https://lu.ma/search?q={url_keywords}&filter=sf"
+        # Navigate to search URL with the city filter
+        search_url = f"{LUMA_BASE_URL}/search?q={url_keywords}&filter={city}"
         logger.info(f"Navigating to search URL: {search_url}")
-        driver.get(search_url)
+        results_ready = search_results_ready()
+        load_page(driver, search_url, span_name="search.navigate", ready=results_ready)
+        
+        wait_until_ready(driver, "search_results", results_ready, wait_time)
         
         if take_screenshots:
-            driver.save_screenshot("direct_search_url.png")
+            capture_screenshot(driver, "direct_search_url")
         
-        time.sleep(wait_time)
         return True
         
     except Exception as e:
         logger.error(f"Failed to search for events: {str(e)}")
         if take_screenshots:
-            driver.save_screenshot("search_error.png")
+            capture_screenshot(driver, "search_error", failure=True)
         return False
 
-def find_event_links(driver, max_events=10, wait_time=5, take_screenshots=False):
+# Marks anchors already returned to Python, so each scroll step only
+# serialises the anchors rendered since the previous step
+HARVEST_LINKS_SCRIPT = """
+var anchors = document.querySelectorAll(arguments[0]);
+var hrefs = [];
+for (var i = 0; i < anchors.length; i++) {
+    if (anchors[i].hasAttribute('data-luma-harvested')) { continue; }
+    anchors[i].setAttribute('data-luma-harvested', '1');
+    hrefs.push(anchors[i].href);
+}
+return hrefs;
+"""
+
+# Scrolls past the last rendered event (the list may live in its own scroll
+# container) and clicks a "load more" style button if the page has one
+SCROLL_RESULTS_SCRIPT = """
+var anchors = document.querySelectorAll(arguments[0]);
+if (anchors.length) { anchors[anchors.length - 1].scrollIntoView({block: 'end'}); }
+window.scrollTo(0, document.body.scrollHeight);
+var buttons = document.querySelectorAll('button');
+for (var i = 0; i < buttons.length; i++) {
+    if (/^\\s*(load|show|see|view) more/i.test(buttons[i].innerText || '')) { buttons[i].click(); break; }
+}
+return anchors.length;
+"""
+
+DEFAULT_MAX_SCROLLS = 20
+
+# Consecutive scroll steps without new events before harvesting stops
+SCROLL_STALL_LIMIT = 2
+
+def is_event_link(link):
+    """Check whether a URL points to an event page."""
+    return bool(link) and ('/events/' in link or '/e/' in link)
+
+def harvest_event_links(driver, seen_links, max_new, wait_time=5, max_scrolls=DEFAULT_MAX_SCROLLS):
     """
-    Find event links from the search results page.
+    Scroll through the search results and yield event links as they render.
+    
+    Each step reads only the anchors added since the previous step, then
+    scrolls and waits for more to appear. Harvesting stops after ``max_new``
+    links, after ``max_scrolls`` steps, as soon as a scroll renders no more
+    anchors within ``wait_time``, or once scrolling only adds events that were
+    already found.
+    
+    Args:
+        driver: WebDriver instance on the search results page
+        seen_links: Set of links already found; updated in place
+        max_new: Maximum number of new links to yield
+        wait_time: Time to wait for each batch of results in seconds
+        max_scrolls: Maximum number of scroll steps
+        
+    Yields:
+        str: Event URL
+    """
+    found = 0
+    stalls = 0
+    for step in range(max_scrolls + 1):
+        new_links = 0
+        with METRICS.span("discovery.harvest"):
+            hrefs = driver.execute_script(HARVEST_LINKS_SCRIPT, EVENT_ANCHOR_SELECTOR) or []
+        for link in hrefs:
+            if not is_event_link(link) or link in seen_links:
+                continue
+            seen_links.add(link)
+            found += 1
+            new_links += 1
+            yield link
+            if found >= max_new:
+                return
+        
+        if step:
+            logger.info(f"Scroll step {step}: {new_links} new event links")
+        # Step 0 re-reads the first screen, whose links are usually all known
+        stalls = stalls + 1 if not new_links else 0
+        if stalls >= SCROLL_STALL_LIMIT or step == max_scrolls:
+            break
+        
+        with METRICS.span("discovery.scroll"):
+            anchor_count = driver.execute_script(SCROLL_RESULTS_SCRIPT, EVENT_ANCHOR_SELECTOR)
+        grew = wait_until_ready(driver, "scroll_results",
+                                lambda driver: event_anchor_state(driver)[1] > anchor_count, wait_time)
+        if not grew:
+            logger.info(f"Scroll step {step + 1}: no more results rendered, stopping")
+            break
+
+@METRICS.timed("discovery.total")
+def iter_event_links(driver, max_events=10, wait_time=5, take_screenshots=False, extraction_mode="dom",
+                     max_scrolls=DEFAULT_MAX_SCROLLS):
+    """
+    Yield event links from the search results page as they are found.
+    
+    The first screen of results is read with the selected extraction mode; if
+    it holds fewer than ``max_events`` links, the results are scrolled to load
+    more (see harvest_event_links()).
     
     Args:
         driver: WebDriver instance
         max_events: Maximum number of events to find
         wait_time: Time to wait for page loading in seconds
         take_screenshots: Whether to save screenshots
+        extraction_mode: "dom" for per-element queries, "script" for one in-page script call
+        max_scrolls: Maximum number of scroll steps for loading more results; 0 disables scrolling
         
-    Returns:
-        list: List of event URLs
+    Yields:
+        str: Event URL
     """
+    found = 0
+    seen_links = set()
     try:
         logger.info(f"Finding up to {max_events} event links from search results")
         
-        # Wait for search results to load
-        time.sleep(wait_time)
+        # Wait for search results to load; returns immediately if they already are
+        wait_until_ready(driver, "search_results", search_results_ready(), wait_time)
         
         if take_screenshots:
-            driver.save_screenshot("search_results.png")
+            capture_screenshot(driver, "search_results")
         
         # Log current URL
         logger.info(f"Current URL: {driver.current_url}")
         
-        event_links = []
-        
-        # Try different approaches to find event links
-        try:
-            # First try: Find event cards and extract links
-            event_elements = driver.find_elements(By.XPATH, "//div[contains(@class, 'event-card') or contains(@class, 'event-item')]")
-            
-            if event_elements:
-                logger.info(f"Found {len(event_elements)} event cards")
-                
-                for element in event_elements:
-                    if len(event_links) >= max_events:
+        if extraction_mode == "script":
+            for link in find_event_links_script(driver, max_events):
+                seen_links.add(link)
+                found += 1
+                yield link
+        else:
+            # Try different approaches to find event links, starting with the one
+            # that worked last time, until we have enough
+            try:
+                for strategy, link_elements in EVENT_LINK_PLAN.iter_matches(driver):
+                    if found >= max_events:
                         break
+                    if not link_elements:
+                        continue
                     
-                    try:
-                        link_element = element.find_element(By.XPATH, ".//a")
-                        link = link_element.get_attribute("href")
-                        
-                        if link and ('/events/' in link or '/e/' in link):
-                            event_links.append(link)
-                            logger.info(f"Added event link: {link}")
-                    except Exception as e:
-                        logger.error(f"Error extracting link from event card: {str(e)}")
-            
-            # Second try: Find direct event links
-            if len(event_links) < max_events:
-                direct_links = driver.find_elements(By.XPATH, "//a[contains(@href, '/events/') or contains(@href, '/e/')]")
-                
-                if direct_links:
-                    logger.info(f"Found {len(direct_links)} direct event links")
-                    
-                    for link_element in direct_links:
-                        if len(event_links) >= max_events:
-                            break
-                        
-                        link = link_element.get_attribute("href")
-                        
-                        # Skip if already in list
-                        if link in event_links:
-                            continue
-                        
-                        event_links.append(link)
-                        logger.info(f"Added event link: {link}")
-            
-            # Third try: Look for any links and filter
-            if len(event_links) < max_events:
-                all_links = driver.find_elements(By.TAG_NAME, "a")
-                
-                if all_links:
-                    logger.info(f"Found {len(all_links)} total links, filtering for event links")
+                    logger.info(f"Found {len(link_elements)} candidate links ({strategy})")
+                    found_before = found
                     
-                    for link_element in all_links:
-                        if len(event_links) >= max_events:
+                    for link_element in link_elements:
+                        if found >= max_events:
                             break
                         
                         link = link_element.get_attribute("href")
                         
                         # Skip if not an event link or already in list
-                        if not link or not ('/events/' in link or '/e/' in link) or link in event_links:
+                        if not is_event_link(link) or link in seen_links:
                             continue
                         
-                        event_links.append(link)
+                        seen_links.add(link)
+                        found += 1
                         logger.info(f"Added event link: {link}")
+                        yield link
+                    
+                    if found_before == 0 and found:
+                        EVENT_LINK_PLAN.record_success(strategy)
+            
+            except Exception as e:
+                logger.error(f"Error finding event links: {str(e)}")
         
-        except Exception as e:
-            logger.error(f"Error finding event links: {str(e)}")
+        # Scroll for more results if the first screen was not enough
+        if found < max_events and found and max_scrolls > 0:
+            logger.info(f"Scrolling for up to {max_events - found} more event links")
+            try:
+                for link in harvest_event_links(driver, seen_links, max_events - found, wait_time, max_scrolls):
+                    found += 1
+                    logger.info(f"Added event link: {link}")
+                    yield link
+            except Exception as e:
+                logger.error(f"Error scrolling search results: {str(e)}")
         
-        logger.info(f"Found {len(event_links)} event links")
-        return event_links
+        logger.info(f"Found {found} event links")
+        METRICS.increment("event_links_found", found)
         
     except Exception as e:
         logger.error(f"Failed to find event links: {str(e)}")
         if take_screenshots:
-            driver.save_screenshot("find_links_error.png")
-        return []
+            capture_screenshot(driver, "find_links_error", failure=True)
+
+def find_event_links(driver, max_events=10, wait_time=5, take_screenshots=False, extraction_mode="dom",
+                     max_scrolls=DEFAULT_MAX_SCROLLS):
+    """
+    Find event links from the search results page.
+    
+    Args:
+        driver: WebDriver instance
+        max_events: Maximum number of events to find
+        wait_time: Time to wait for page loading in seconds
+        take_screenshots: Whether to save screenshots
+        extraction_mode: "dom" for per-element queries, "script" for one in-page script call
+        max_scrolls: Maximum number of scroll steps for loading more results
+        
+    Returns:
+        list: List of event URLs
+    """
+    return list(iter_event_links(driver, max_events, wait_time, take_screenshots, extraction_mode, max_scrolls))
+
+def split_keywords(keywords):
+    """
+    Split a comma-separated keyword string into unique keywords.
+    
+    Args:
+        keywords: Comma-separated keywords, e.g. "AI,tech,startup"
+    
+    Returns:
+        list: Keywords in their original order, without blanks or case-insensitive repeats
+    """
+    unique = []
+    seen = set()
+    for keyword in (keywords or "").split(','):
+        keyword = keyword.strip()
+        if keyword and keyword.lower() not in seen:
+            seen.add(keyword.lower())
+            unique.append(keyword)
+    return unique
+
+def event_id_from_url(event_url):
+    """
+    Return the event ID of an event URL, i.e. its last path segment ("evt-..." or a slug).
+    
+    Query strings and trailing slashes are ignored, so the same event reached
+    through differently decorated links maps to one ID.
+    """
+    path = urlparse(event_url).path.rstrip('/')
+    return path.rsplit('/', 1)[-1] or event_url
+
+def search_keyword_links(pool, keyword, max_events=10, wait_time=5, take_screenshots=False,
+                         extraction_mode="dom", reuse_page=False, release=None,
+                         max_scrolls=DEFAULT_MAX_SCROLLS, city=DEFAULT_CITY):
+    """
+    Run one keyword search on a pooled browser session.
+    
+    Args:
+        pool: DriverPool instance providing the session
+        keyword: Single keyword to search for
+        max_events: Maximum number of event links to return
+        wait_time: Time to wait for page loading in seconds
+        take_screenshots: Whether to save screenshots
+        extraction_mode: "dom" or "script", see iter_event_links()
+        reuse_page: Skip navigation if the session is already on the city page
+        release: Optional callable returning a healthy session to its pool;
+                 defaults to pool.release()
+        max_scrolls: Maximum number of scroll steps for loading more results
+        city: Luma city slug to search in
+    
+    Returns:
+        list: Event URLs in search result order
+    """
+    driver = pool.acquire()
+    try:
+        if not search_for_events(driver, keyword, wait_time, take_screenshots, reuse_page=reuse_page, city=city):
+            logger.error(f"Failed to search for events matching '{keyword}' in {city}")
+            return []
+        event_links = find_event_links(driver, max_events=max_events, wait_time=wait_time,
+                                       take_screenshots=take_screenshots, extraction_mode=extraction_mode,
+                                       max_scrolls=max_scrolls)
+        logger.info(f"Keyword '{keyword}' matched {len(event_links)} event links in {city}")
+        return event_links
+    finally:
+        if not is_driver_alive(driver):
+            pool.discard(driver)
+        elif release is not None:
+            release(driver)
+        else:
+            pool.release(driver)
+
+def fan_out_search(pool, keywords, max_events=10, wait_time=5, take_screenshots=False,
+                   extraction_mode="dom", reuse_page=False, release=None, max_scrolls=DEFAULT_MAX_SCROLLS,
+                   city=DEFAULT_CITY):
+    """
+    Search several keywords concurrently and merge the results by event ID.
+    
+    Each keyword runs as its own query on a session from the pool, so up to
+    ``pool.size`` searches are in flight at once. Links that point to the same
+    event are merged into one entry; events matched by more keywords rank
+    first, ties are broken by the best position in any result list.
+    
+    Args:
+        pool: DriverPool instance providing the search sessions
+        keywords: List of keywords, see split_keywords()
+        max_events: Maximum number of event links per keyword
+        wait_time: Time to wait for page loading in seconds
+        take_screenshots: Whether to save screenshots
+        extraction_mode: "dom" or "script", see iter_event_links()
+        reuse_page: Skip navigation if a session is already on the city page
+        release: Optional callable returning a healthy session to its pool
+        max_scrolls: Maximum number of scroll steps for loading more results
+        city: Luma city slug to search in
+    
+    Returns:
+        list: Ranked dicts with url, event_id, keywords (the matching keywords)
+              and hits (the number of matching keywords)
+    """
+    def search(keyword):
+        try:
+            return search_keyword_links(pool, keyword, max_events, wait_time, take_screenshots,
+                                        extraction_mode, reuse_page=reuse_page, release=release,
+                                        max_scrolls=max_scrolls, city=city)
+        except Exception as e:
+            logger.error(f"Search for '{keyword}' failed: {str(e)}")
+            return []
+    
+    logger.info(f"Searching {len(keywords)} keywords on up to {pool.size} sessions")
+    with ThreadPoolExecutor(max_workers=max(1, min(len(keywords), pool.size))) as executor:
+        results = list(executor.map(search, keywords))
+    
+    merged = {}
+    for keyword, event_links in zip(keywords, results):
+        for position, link in enumerate(event_links):
+            event_id = event_id_from_url(link)
+            entry = merged.get(event_id)
+            if entry is None:
+                entry = merged[event_id] = {"url": link, "event_id": event_id, "keywords": [],
+                                            "hits": 0, "best_position": position}
+            if keyword not in entry["keywords"]:
+                entry["keywords"].append(keyword)
+                entry["hits"] += 1
+            entry["best_position"] = min(entry["best_position"], position)
+    
+    # Dicts keep insertion order, so sorted() falls back to first-seen order
+    ranked = sorted(merged.values(), key=lambda entry: (-entry["hits"], entry["best_position"]))
+    for entry in ranked:
+        del entry["best_position"]
+    
+    duplicates = sum(len(event_links) for event_links in results) - len(ranked)
+    logger.info(f"Merged {len(ranked)} unique events from {len(keywords)} keywords "
+                f"({duplicates} duplicate matches)")
+    return ranked
+
+TITLE_XPATH = "//h1 | //h2[contains(@class, 'title')] | //div[contains(@class, 'title') and not(contains(@class, 'subtitle'))]"
+
+# Collects every candidate link in one round trip: event-card anchors first,
+# then all other anchors in document order
+COLLECT_LINKS_SCRIPT = """
+var hrefs = [];
+var cards = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+for (var i = 0; i < cards.snapshotLength; i++) { hrefs.push(cards.snapshotItem(i).href); }
+var anchors = document.getElementsByTagName('a');
+for (var j = 0; j < anchors.length; j++) { hrefs.push(anchors[j].href); }
+return hrefs;
+"""
+
+# Evaluates the title XPath and the speaker/summary fallback chains in one
+# round trip. Chains are lists of [label, xpath]; the first label that
+# matches anything is returned with the element texts.
+EXTRACT_EVENT_SCRIPT = """
+function texts(xpath, limit) {
+    var result = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var out = [];
+    for (var i = 0; i < result.snapshotLength && (!limit || i < limit); i++) {
+        var node = result.snapshotItem(i);
+        out.push(node.innerText || node.textContent || '');
+    }
+    return out;
+}
+function firstMatch(chain, limit) {
+    for (var i = 0; i < chain.length; i++) {
+        var found = texts(chain[i][1], limit);
+        if (found.length) { return [chain[i][0], found]; }
+    }
+    return [null, []];
+}
+return {
+    title: texts(arguments[0], 1),
+    speakers: firstMatch(arguments[1], 0),
+    summary: firstMatch(arguments[2], 1)
+};
+"""
+
+def find_event_links_script(driver, max_events=10):
+    """
+    Collect event links with a single in-page script call.
+    
+    Args:
+        driver: WebDriver instance
+        max_events: Maximum number of events to find
+        
+    Returns:
+        list: Unique event URLs in page order
+    """
+    card_xpath = EVENT_LINK_PLAN.strategies[0][2]
+    hrefs = driver.execute_script(COLLECT_LINKS_SCRIPT, card_xpath) or []
+    logger.info(f"Collected {len(hrefs)} candidate links in one script call")
+    
+    event_links = []
+    seen_links = set()
+    for link in hrefs:
+        if len(event_links) >= max_events:
+            break
+        if not is_event_link(link) or link in seen_links:
+            continue
+        seen_links.add(link)
+        event_links.append(link)
+        logger.info(f"Added event link: {link}")
+    return event_links
+
+def collect_event_texts_script(driver):
+    """
+    Read the raw title, speaker and summary texts with a single in-page script call.
+    
+    Args:
+        driver: WebDriver instance on an event page
+        
+    Returns:
+        tuple: (title text or None, list of speaker texts, summary text or None)
+    """
+    def chain(plan):
+        return [[label, selector] for label, _, selector in plan.ordered_strategies()]
+    
+    payload = driver.execute_script(EXTRACT_EVENT_SCRIPT, TITLE_XPATH, chain(SPEAKER_PLAN), chain(SUMMARY_PLAN))
+    
+    speaker_strategy, speaker_texts = payload["speakers"]
+    if speaker_strategy:
+        SPEAKER_PLAN.record_success(speaker_strategy)
+    summary_strategy, summary_texts = payload["summary"]
+    if summary_strategy:
+        SUMMARY_PLAN.record_success(summary_strategy)
+    
+    title_texts = payload["title"]
+    return (title_texts[0] if title_texts else None,
+            speaker_texts,
+            summary_texts[0] if summary_texts else None)
+
+def collect_event_texts_dom(driver):
+    """
+    Read the raw title, speaker and summary texts with individual element queries.
+    
+    Args:
+        driver: WebDriver instance on an event page
+        
+    Returns:
+        tuple: (title text or None, list of speaker texts, summary text or None)
+    """
+    title_text = None
+    try:
+        title_elements = driver.find_elements(By.XPATH, TITLE_XPATH)
+        if title_elements:
+            title_text = title_elements[0].text
+    except Exception as e:
+        logger.error(f"Error extracting event title: {str(e)}")
+    
+    speaker_texts = []
+    try:
+        # Try different approaches to find speakers
+        _, speaker_elements = SPEAKER_PLAN.find(driver)
+        speaker_texts = [element.text for element in speaker_elements]
+    except Exception as e:
+        logger.error(f"Error extracting speakers: {str(e)}")
+    
+    summary_text = None
+    try:
+        # Try different approaches to find summary
+        _, summary_elements = SUMMARY_PLAN.find(driver)
+        if summary_elements:
+            summary_text = summary_elements[0].text
+    except Exception as e:
+        logger.error(f"Error extracting event summary: {str(e)}")
+    
+    return title_text, speaker_texts, summary_text
 
-def extract_event_details(driver, event_url, wait_time=5, take_screenshots=False):
+@METRICS.timed("event.total")
+def extract_event_details(driver, event_url, wait_time=5, take_screenshots=False, extraction_mode="dom"):
     """
     Extract detailed information from an event page.
     
@@ -298,118 +1083,175 @@ def extract_event_details(driver, event_url, wait_time=5, take_screenshots=False
         event_url: URL of the event page
         wait_time: Time to wait for page loading in seconds
         take_screenshots: Whether to save screenshots
+        extraction_mode: "dom" for per-element queries, "script" for one in-page script call
         
     Returns:
-        dict: Event details including title, speakers, summary, and link
+        dict: Event details including title, speakers, summary, and link (plus
+              start time when the page carries structured data)
     """
     try:
         logger.info(f"Extracting details from event: {event_url}")
         
         # Navigate to event page
-        driver.get(event_url)
-        time.sleep(wait_time)
+        if not load_page(driver, event_url, span_name="event.navigate", ready=event_page_ready):
+            return error_event(event_url, "rate limited by the site")
+        wait_until_ready(driver, "event_page", event_page_ready, wait_time)
+        try:
+            requests_made, transferred = page_transfer_stats(driver)
+            METRICS.increment("bytes_transferred", transferred)
+            logger.info(f"Event page loaded {transferred / 1024:.1f} KB in {requests_made} requests")
+        except Exception as e:
+            logger.error(f"Could not read page transfer stats: {str(e)}")
         
         # Take screenshot of event page
         if take_screenshots:
-            event_id = event_url.split("/")[-1]
-            screenshot_file = f"event_{event_id}.png"
-            driver.save_screenshot(screenshot_file)
-            logger.info(f"Screenshot saved: {screenshot_file}")
+            capture_screenshot(driver, f"event_{event_id_from_url(event_url)}")
         
-        # Extract event title
-        title = "Unknown Title"
+        # Structured data embedded in the page source is both faster and more
+        # accurate than the element heuristics below
+        structured_event = None
         try:
-            title_elements = driver.find_elements(By.XPATH, "//h1 | //h2[contains(@class, 'title')] | //div[contains(@class, 'title') and not(contains(@class, 'subtitle'))]")
-            if title_elements:
-                title = title_elements[0].text.strip()
-                logger.info(f"Extracted event title: {title}")
+            with METRICS.span("event.structured_data"):
+                structured_event = parse_structured_event(driver.page_source, event_url)
+            if structured_event and is_event_complete(structured_event):
+                logger.info(f"Extracted event from structured data: {structured_event['title']}")
+                return structured_event
         except Exception as e:
-            logger.error(f"Error extracting event title: {str(e)}")
+            logger.error(f"Error reading structured event data: {str(e)}")
+        
+        with METRICS.span(f"event.collect_texts_{extraction_mode}"):
+            if extraction_mode == "script":
+                title_text, speaker_texts, summary_text = collect_event_texts_script(driver)
+            else:
+                title_text, speaker_texts, summary_text = collect_event_texts_dom(driver)
+        
+        # Extract event title
+        title = "Unknown Title"
+        if title_text:
+            title = title_text.strip()
+            logger.info(f"Extracted event title: {title}")
         
         # Extract speakers
         speakers = []
-        try:
-            # Try different approaches to find speakers
-            speaker_elements = driver.find_elements(By.XPATH, "//div[contains(@class, 'speaker') or contains(@class, 'host')]")
-            
-            if not speaker_elements:
-                # Try alternative selectors
-                speaker_elements = driver.find_elements(By.XPATH, "//div[contains(text(), 'Speaker') or contains(text(), 'Host')]/following-sibling::div")
-            
-            if not speaker_elements:
-                # Try looking for profile pictures with names
-                speaker_elements = driver.find_elements(By.XPATH, "//img[contains(@alt, 'profile') or contains(@class, 'avatar')]/parent::div/parent::div")
-            
-            for element in speaker_elements:
-                speaker_text = element.text.strip()
-                if speaker_text:
-                    # Try to parse name, title, company
-                    lines = speaker_text.split('\n')
-                    name = lines[0] if lines else "Unknown"
-                    title_company = ' '.join(lines[1:]) if len(lines) > 1 else ""
-                    
-                    speakers.append({
-                        "name": name,
-                        "title_company": title_company
-                    })
-            
-            if speakers:
-                logger.info(f"Extracted {len(speakers)} speakers")
-            else:
-                logger.info("No speakers found")
-        except Exception as e:
-            logger.error(f"Error extracting speakers: {str(e)}")
+        for speaker_text in speaker_texts:
+            speaker_text = speaker_text.strip()
+            if speaker_text:
+                # Try to parse name, title, company
+                lines = speaker_text.split('\n')
+                name = lines[0] if lines else "Unknown"
+                title_company = ' '.join(lines[1:]) if len(lines) > 1 else ""
+                
+                speakers.append({
+                    "name": name,
+                    "title_company": title_company
+                })
+        
+        if speakers:
+            logger.info(f"Extracted {len(speakers)} speakers")
+        else:
+            logger.info("No speakers found")
         
         # Extract event summary
         summary = "No summary available"
-        try:
-            # Try different approaches to find summary
-            summary_elements = driver.find_elements(By.XPATH, "//div[contains(@class, 'description') or contains(@class, 'summary')]")
-            
-            if not summary_elements:
-                # Try alternative selectors
-                summary_elements = driver.find_elements(By.XPATH, "//div[contains(text(), 'About') or contains(text(), 'Description')]/following-sibling::div")
-            
-            if not summary_elements:
-                # Try looking for paragraphs in the main content
-                summary_elements = driver.find_elements(By.XPATH, "//main//p")
-            
-            if summary_elements:
-                summary = summary_elements[0].text.strip()
-                # Truncate if too long
-                if len(summary) > 500:
-                    summary = summary[:497] + "..."
-                logger.info(f"Extracted event summary: {summary[:50]}...")
-        except Exception as e:
-            logger.error(f"Error extracting event summary: {str(e)}")
+        if summary_text and summary_text.strip():
+            summary = summary_text.strip()
+            # Truncate if too long
+            if len(summary) > MAX_SUMMARY_LENGTH:
+                summary = summary[:MAX_SUMMARY_LENGTH - 3] + "..."
+            logger.info(f"Extracted event summary: {summary[:50]}...")
         
-        return {
+        # Keep what the structured data did have, as the HTTP path does
+        return merge_structured_event({
             "title": title,
             "speakers": speakers,
             "summary": summary,
             "url": event_url
-        }
+        }, structured_event)
         
     except Exception as e:
         logger.error(f"Failed to extract event details: {str(e)}")
-        return {
-            "title": "Error extracting details",
-            "speakers": [],
-            "summary": f"Error: {str(e)}",
-            "url": event_url
-        }
+        if take_screenshots:
+            capture_screenshot(driver, f"event_{event_id_from_url(event_url)}_error", failure=True)
+        return error_event(event_url, str(e))
 
-def main():
-    """Main function to run the Luma SF events detailed scraper."""
-    # Parse command-line arguments
-    args = parse_arguments()
+# Chrome flags for --lean: skip background work we never need while scraping
+LEAN_CHROME_FLAGS = [
+    '--blink-settings=imagesEnabled=false',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-notifications',
+    '--mute-audio',
+    '--no-first-run',
+    '--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication',
+]
+
+LEAN_CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_setting_values.geolocation": 2,
+}
+
+# Requests blocked through CDP in --lean mode: images, media, fonts and trackers
+LEAN_BLOCKED_URL_PATTERNS = [
+    "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.ico*",
+    "*images.lumacdn.com*",
+    "*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*",
+    "*.woff*", "*.ttf*", "*.otf*", "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*segment.io*", "*segment.com*", "*facebook.net*", "*hotjar.com*",
+    "*mixpanel.com*", "*intercom.io*", "*sentry.io*", "*clarity.ms*",
+]
+
+PAGE_TRANSFER_SCRIPT = """
+var entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+var bytes = 0;
+for (var i = 0; i < entries.length; i++) { bytes += entries[i].transferSize || 0; }
+return [entries.length, bytes];
+"""
+
+def page_transfer_stats(driver):
+    """
+    Report how much the current page downloaded, from the Resource Timing API.
     
-    # Set default output file if not specified
-    if not args.output:
-        keywords_slug = args.keywords.lower().replace(",", "_").replace(" ", "_")
-        args.output = f"sf_events_detailed_{keywords_slug}.txt"
+    Args:
+        driver: WebDriver instance
+        
+    Returns:
+        tuple: (number of requests, bytes transferred)
+    """
+    count, transferred = driver.execute_script(PAGE_TRANSFER_SCRIPT)
+    return count, transferred
+
+def apply_lean_profile(options):
+    """Configure Chrome options for the --lean profile."""
+    options.page_load_strategy = 'eager'
+    for flag in LEAN_CHROME_FLAGS:
+        options.add_argument(flag)
+    options.add_experimental_option("prefs", LEAN_CHROME_PREFS)
+
+def block_heavy_resources(driver):
+    """Block images, media, fonts and trackers for the whole session via CDP."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URL_PATTERNS})
+        logger.info(f"Blocking {len(LEAN_BLOCKED_URL_PATTERNS)} heavy resource patterns")
+    except Exception as e:
+        logger.error(f"Could not enable network blocking: {str(e)}")
+
+def create_driver(args):
+    """
+    Create and configure a Chrome WebDriver session.
     
-    # Initialize WebDriver
+    Args:
+        args: Parsed command-line arguments
+        
+    Returns:
+        WebDriver: Initialized Chrome WebDriver instance
+    """
     logger.info("Initializing WebDriver")
     options = webdriver.ChromeOptions()
     if args.headless:
@@ -419,86 +1261,746 @@ def main():
     options.add_argument('--disable-dev-shm-usage')
     options.add_argument('--disable-gpu')
     options.add_argument('--window-size=1920,1080')
+    if args.lean:
+        logger.info("Using lean browser profile")
+        apply_lean_profile(options)
+    
+    if args.chromedriver_path:
+        # Use specified ChromeDriver path
+        logger.info(f"Using ChromeDriver at: {args.chromedriver_path}")
+        service = Service(executable_path=args.chromedriver_path)
+        driver = webdriver.Chrome(service=service, options=options)
+    else:
+        # Let Selenium handle driver management (better for Mac ARM)
+        logger.info("Using Selenium's built-in driver management")
+        driver = webdriver.Chrome(options=options)
     
-    driver = None
+    # Waits are explicit (readiness predicates); an implicit wait would make every
+    # empty lookup in the selector fallback chains block for the full timeout
+    driver.implicitly_wait(0)
+    if args.lean:
+        block_heavy_resources(driver)
+    logger.info(f"WebDriver initialized with maximum wait time: {args.wait_time} seconds")
+    return driver
+
+def is_driver_alive(driver):
+    """
+    Check whether a WebDriver session is still usable.
     
+    Args:
+        driver: WebDriver instance
+        
+    Returns:
+        bool: True if the session responds, False if it has crashed or been closed
+    """
     try:
-        # Initialize Chrome driver
-        if args.chromedriver_path:
-            # Use specified ChromeDriver path
-            logger.info(f"Using ChromeDriver at: {args.chromedriver_path}")
-            service = Service(executable_path=args.chromedriver_path)
-            driver = webdriver.Chrome(service=service, options=options)
-        else:
-            # Let Selenium handle driver management (better for Mac ARM)
-            logger.info("Using Selenium's built-in driver management")
-            driver = webdriver.Chrome(options=options)
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+class DriverPool:
+    """
+    Pool of WebDriver sessions shared between worker threads.
+    
+    Sessions are created lazily up to ``size``. A crashed session is discarded
+    and a fresh one is created the next time a worker needs it.
+    """
+    
+    def __init__(self, factory, size=1):
+        """
+        Args:
+            factory: Callable returning a new WebDriver instance
+            size: Maximum number of concurrent sessions
+        """
+        self.factory = factory
+        self.size = max(1, size)
+        self._idle = []
+        self._drivers = []
+        # Notified whenever a session is returned or a slot frees up
+        self._condition = threading.Condition()
+    
+    def acquire(self):
+        """
+        Take an idle session, creating one if the pool is below its size.
         
-        driver.implicitly_wait(args.wait_time)
-        logger.info(f"WebDriver initialized with wait time: {args.wait_time} seconds")
+        Blocks until a session is released or a discarded one frees a slot.
+        """
+        with self._condition:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if len(self._drivers) < self.size:
+                    # Reserve the slot before the (slow) browser startup
+                    self._drivers.append(None)
+                    break
+                self._condition.wait()
         
-        # Search for events
-        if not search_for_events(driver, args.keywords, args.wait_time, args.screenshots):
-            logger.error("Failed to search for events. Exiting.")
-            return 1
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._condition:
+                self._drivers.remove(None)
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._drivers[self._drivers.index(None)] = driver
+        return driver
+    
+    def release(self, driver):
+        """Return a healthy session to the pool."""
+        with self._condition:
+            self._idle.append(driver)
+            self._condition.notify()
+    
+    def discard(self, driver):
+        """Drop a broken session so that a replacement can be created."""
+        with self._condition:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+            if driver in self._idle:
+                self._idle.remove(driver)
+            self._condition.notify()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    def close(self):
+        """Quit every session owned by the pool."""
+        with self._condition:
+            drivers = [driver for driver in self._drivers if driver is not None]
+            self._drivers = []
+            self._idle = []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.error(f"Error closing WebDriver: {str(e)}")
+
+def extract_event_with_pool(pool, event_url, wait_time=5, take_screenshots=False,
+                            http_session=None, extraction_mode="dom", cache=None, refresh=False):
+    """
+    Extract event details using a session borrowed from a driver pool.
+    
+    A fresh cache entry is returned without loading the page. If an HTTP
+    session is given, the static page is tried first (as a conditional request
+    when an expired cache entry has validators) and the browser is only used
+    when the HTML lacks the event fields. If the browser session crashes while
+    the page is processed, it is replaced and the event is retried once on a
+    fresh session.
+    
+    Args:
+        pool: DriverPool instance
+        event_url: URL of the event page
+        wait_time: Time to wait for page loading in seconds
+        take_screenshots: Whether to save screenshots
+        http_session: Optional requests session for HTTP-first fetching
+        extraction_mode: "dom" or "script", see extract_event_details()
+        cache: Optional EventCache for reusing previously extracted events
+        refresh: Whether to ignore cached entries and refetch every page
+        
+    Returns:
+        dict: Event details including title, speakers, summary, and link
+    """
+    cached_entry = None
+    if cache is not None and not refresh:
+        cached_event = cache.get(event_url)
+        if cached_event:
+            METRICS.increment("cache_hits")
+            logger.info(f"Using cached details for {event_url}")
+            return cached_event
+        cached_entry = cache.lookup(event_url)
+    
+    if http_session is not None:
+        validators = {}
+        if cached_entry:
+            validators = {"etag": cached_entry["etag"], "last_modified": cached_entry["last_modified"]}
+        event_details, validators = fetch_event_page(http_session, event_url, timeout=max(wait_time, 1) * 2,
+                                                     rate_limiter=RATE_LIMITER, **validators)
+        if event_details == NOT_MODIFIED:
+            cache.touch(event_url)
+            return cached_entry["record"]
+        if event_details:
+            if cache is not None:
+                cache.put(event_url, event_details, **validators)
+            return event_details
+        logger.info(f"Falling back to browser for {event_url}")
+    
+    event_details = None
+    for attempt in range(2):
+        try:
+            driver = pool.acquire()
+        except Exception as e:
+            logger.error(f"Could not start WebDriver session for {event_url}: {str(e)}")
+            break
         
-        # Find event links
-        logger.info(f"Finding up to {args.max_events} event links")
-        event_links = find_event_links(driver, max_events=args.max_events, wait_time=args.wait_time, 
-                                      take_screenshots=args.screenshots)
+        event_details = extract_event_details(driver, event_url, wait_time, take_screenshots,
+                                              extraction_mode=extraction_mode)
         
-        if not event_links:
-            logger.error("No event links found. Exiting.")
-            return 1
+        if is_driver_alive(driver):
+            pool.release(driver)
+            if cache is not None and event_details.get("title") != ERROR_TITLE:
+                cache.put(event_url, event_details)
+            return event_details
+        
+        logger.error(f"WebDriver session crashed while processing {event_url} (attempt {attempt + 1})")
+        pool.discard(driver)
+    
+    if event_details is None:
+        event_details = error_event(event_url, "no WebDriver session available")
+    return event_details
+
+def error_event(event_url, message):
+    """Build the placeholder record used when an event could not be extracted."""
+    METRICS.increment("errors")
+    return {
+        "title": ERROR_TITLE,
+        "speakers": [],
+        "summary": f"Error: {message}",
+        "url": event_url
+    }
+
+def run_pipeline(event_links, extract, write, workers=1):
+    """
+    Stream event links through concurrent detail workers into a writer.
+    
+    A discovery thread pulls links from ``event_links`` (typically a generator
+    that is still scraping the results page), ``workers`` threads extract the
+    details, and the calling thread hands each finished record to ``write`` as
+    soon as all earlier records have been written, so output keeps discovery
+    order. At most a few records per worker are held in memory at any time.
+    
+    Args:
+        event_links: Iterable of event URLs, consumed lazily
+        extract: Callable taking (index, event_url) and returning an event dict
+        write: Callable receiving each event dict in discovery order
+        workers: Number of events processed at the same time
+        
+    Returns:
+        int: Number of events written
+    """
+    workers = max(1, workers)
+    link_queue = queue.Queue()
+    result_queue = queue.Queue()
+    # Bounds the number of links taken but not yet written
+    window = threading.Semaphore(workers * 2)
+    discovery_done = object()
+    
+    def discover():
+        count = 0
+        try:
+            for count, link in enumerate(event_links, 1):
+                link_queue.put((count, link))
+        except Exception as e:
+            logger.error(f"Event discovery failed: {str(e)}")
+        finally:
+            result_queue.put((discovery_done, count))
+            for _ in range(workers):
+                link_queue.put(None)
+    
+    def consume():
+        while True:
+            window.acquire()
+            item = link_queue.get()
+            if item is None:
+                window.release()
+                return
+            index, link = item
+            try:
+                event = extract(index, link)
+            except Exception as e:
+                logger.error(f"Failed to extract event details: {str(e)}")
+                event = error_event(link, str(e))
+            result_queue.put((index, event))
+    
+    threads = [threading.Thread(target=discover, name="discovery", daemon=True)]
+    threads += [threading.Thread(target=consume, name=f"detail-worker-{i}", daemon=True)
+                for i in range(1, workers + 1)]
+    for thread in threads:
+        thread.start()
+    
+    total = None
+    next_index = 1
+    pending = {}
+    while total is None or next_index <= total:
+        index, payload = result_queue.get()
+        if index is discovery_done:
+            total = payload
+            continue
+        pending[index] = payload
+        while next_index in pending:
+            write(pending.pop(next_index))
+            window.release()
+            next_index += 1
+    
+    return next_index - 1
+
+def extract_events_parallel(pool, event_links, wait_time=5, take_screenshots=False, workers=1,
+                            http_session=None, extraction_mode="dom", cache=None, refresh=False):
+    """
+    Extract details for many events concurrently, one browser session per worker.
+    
+    Args:
+        pool: DriverPool instance providing the browser sessions
+        event_links: Iterable of event URLs
+        wait_time: Time to wait for page loading in seconds
+        take_screenshots: Whether to save screenshots
+        workers: Number of events processed at the same time
+        http_session: Optional requests session for HTTP-first fetching
+        extraction_mode: "dom" or "script", see extract_event_details()
+        cache: Optional EventCache for reusing previously extracted events
+        refresh: Whether to ignore cached entries and refetch every page
+        
+    Returns:
+        list: Event details in the same order as event_links
+    """
+    def extract(index, link):
+        logger.info(f"Processing event {index}: {link}")
+        return extract_event_with_pool(pool, link, wait_time, take_screenshots,
+                                       http_session=http_session, extraction_mode=extraction_mode,
+                                       cache=cache, refresh=refresh)
+    
+    events = []
+    run_pipeline(event_links, extract, events.append, workers=workers)
+    return events
+
+def discover_city_links(pool, args, city, keywords):
+    """
+    Search one city for the given keywords.
+    
+    Args:
+        pool: DriverPool instance providing the search session
+        args: Parsed command-line arguments
+        city: Luma city slug
+        keywords: List of keywords, see split_keywords()
+    
+    Returns:
+        list: (event URL, matching keywords) tuples, best matches first
+    """
+    ranked = fan_out_search(pool, keywords, max_events=args.max_events, wait_time=args.wait_time,
+                            take_screenshots=args.screenshots, extraction_mode=args.extraction_mode,
+                            max_scrolls=args.max_scrolls, city=city)
+    return [(entry["url"], entry["keywords"]) for entry in ranked[:args.max_events]]
+
+def city_shard_worker(args, cities, keywords, next_city, producers_left, pending, work_queue, result_queue):
+    """
+    Worker process of a multi-city crawl.
+    
+    Each process has its own browser sessions, HTTP session and cache
+    connection. It claims cities one at a time, searches them and puts the
+    event links on the shared, bounded work queue, while ``args.workers``
+    threads take links from that queue (whichever city they came from) and
+    send the extracted records to the result queue. When the work queue is
+    full, the searching thread extracts a queued event itself instead of
+    blocking, so shards can never wait on each other in a cycle.
+    
+    Args:
+        args: Parsed command-line arguments
+        cities: List of city slugs
+        keywords: List of keywords, see split_keywords()
+        next_city: Shared integer, index of the next unclaimed city
+        producers_left: Shared integer, number of cities not yet fully searched
+        pending: Shared integer, number of queued or in-flight events
+        work_queue: Bounded queue of (city, event URL, matching keywords)
+        result_queue: Queue receiving ("event", record) and a final ("done", stats)
+    """
+    name = multiprocessing.current_process().name
+    set_base_url(args.base_url)
+    # A forked process starts with a copy of the parent's samples
+    METRICS.reset()
+    configure_rate_limiter(args)
+    if args.screenshots:
+        configure_screenshots(args, prefix=f"{name}_")
+    pool = DriverPool(lambda: create_driver(args), size=args.workers)
+    http_session = create_http_session(pool_size=max(args.workers, 1)) if args.fetch_mode == 'http' else None
+    cache = None
+    if args.cache_ttl > 0:
+        cache = EventCache(args.cache_path, ttl=args.cache_ttl * 3600, max_entries=args.cache_max_entries)
+    processed = [0]
+    processed_lock = threading.Lock()
+    
+    def process(item):
+        city, link, matched = item
+        try:
+            logger.info(f"[{name}] Processing {city} event: {link}")
+            event = extract_event_with_pool(pool, link, args.wait_time, args.screenshots,
+                                            http_session=http_session, extraction_mode=args.extraction_mode,
+                                            cache=cache, refresh=args.refresh)
+        except Exception as e:
+            logger.error(f"Failed to extract event details: {str(e)}")
+            event = error_event(link, str(e))
+        result_queue.put(("event", dict(event, city=city, matched_keywords=matched)))
+        with processed_lock:
+            processed[0] += 1
+        with pending.get_lock():
+            pending.value -= 1
+    
+    def consume():
+        while True:
+            try:
+                item = work_queue.get(timeout=0.2)
+            except queue.Empty:
+                # Nothing is queued, in flight or still to be searched
+                if producers_left.value == 0 and pending.value == 0:
+                    return
+                continue
+            process(item)
+    
+    def submit(item):
+        with pending.get_lock():
+            pending.value += 1
+        while True:
+            try:
+                work_queue.put(item, block=False)
+                return
+            except queue.Full:
+                try:
+                    process(work_queue.get(timeout=0.2))
+                except queue.Empty:
+                    pass
+    
+    consumers = [threading.Thread(target=consume, name=f"detail-worker-{i}", daemon=True)
+                 for i in range(1, args.workers + 1)]
+    for thread in consumers:
+        thread.start()
+    
+    try:
+        while True:
+            with next_city.get_lock():
+                index = next_city.value
+                next_city.value += 1
+            if index >= len(cities):
+                break
+            
+            city = cities[index]
+            try:
+                event_links = discover_city_links(pool, args, city, keywords)
+                logger.info(f"[{name}] Queueing {len(event_links)} events from {city}")
+                for link, matched in event_links:
+                    submit((city, link, matched))
+            except Exception as e:
+                logger.error(f"[{name}] Searching {city} failed: {str(e)}")
+            finally:
+                with producers_left.get_lock():
+                    producers_left.value -= 1
+        
+        for thread in consumers:
+            thread.join()
+    finally:
+        RATE_LIMITER.log_stats()
+        if cache:
+            cache.close()
+        if http_session:
+            http_session.close()
+        pool.close()
+        SCREENSHOTS.close()
+        result_queue.put(("done", {"processed": processed[0], "metrics": METRICS.export()}))
+
+def run_city_shards(args, cities, keywords, write, processes=None):
+    """
+    Crawl several cities in parallel worker processes and collect one output.
+    
+    Args:
+        args: Parsed command-line arguments
+        cities: List of city slugs
+        keywords: List of keywords, see split_keywords()
+        write: Callable receiving each event dict, tagged with its city
+        processes: Number of worker processes (default: one per city, up to the CPU count)
+    
+    Returns:
+        int: Number of events written
+    """
+    processes = max(1, min(len(cities), processes or os.cpu_count() or 1))
+    context = multiprocessing.get_context()
+    next_city = context.Value('i', 0)
+    producers_left = context.Value('i', len(cities))
+    pending = context.Value('i', 0)
+    # Bounds the links waiting for a detail worker across all shards
+    work_queue = context.Queue(maxsize=processes * max(args.workers, 1) * 2)
+    result_queue = context.Queue()
+    
+    # Every process has its own rate limiter; split the per-host budget between them
+    shard_args = argparse.Namespace(**vars(args))
+    shard_args.rate_limit = args.rate_limit / processes
+    shard_args.max_host_concurrency = max(1, args.max_host_concurrency // processes)
+    shard_args.screenshot_max_count = max(1, args.screenshot_max_count // processes)
+    shard_args.screenshot_max_mb = args.screenshot_max_mb / processes
+    
+    logger.info(f"Crawling {len(cities)} cities with {processes} worker processes")
+    workers = [context.Process(target=city_shard_worker, name=f"city-shard-{i}",
+                               args=(shard_args, cities, keywords, next_city, producers_left, pending,
+                                     work_queue, result_queue))
+               for i in range(1, processes + 1)]
+    for worker in workers:
+        worker.start()
+    
+    total = 0
+    finished = 0
+    seen_events = set()
+    start = time.monotonic()
+    try:
+        while finished < processes:
+            try:
+                kind, payload = result_queue.get(timeout=1)
+            except queue.Empty:
+                if not any(worker.is_alive() for worker in workers):
+                    logger.error("City worker processes exited without finishing")
+                    break
+                continue
+            
+            if kind == "done":
+                finished += 1
+                METRICS.merge(payload["metrics"])
+                continue
+            
+            # The same event can be listed under several cities; keep the first
+            event_id = event_id_from_url(payload["url"])
+            if event_id in seen_events:
+                logger.info(f"Skipping event already collected for another city: {payload['url']}")
+                continue
+            seen_events.add(event_id)
+            write(payload)
+            total += 1
+    finally:
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+    
+    elapsed = time.monotonic() - start
+    logger.info(f"Collected {total} events from {len(cities)} cities in {elapsed:.1f}s "
+                f"({total / elapsed if elapsed else 0:.2f} events/s)")
+    return total
+
+def answer_from_index(index, args, cities=None):
+    """
+    Answer --query from the local event index.
+    
+    Args:
+        index: EventIndex instance
+        args: Parsed command-line arguments
+        cities: City slugs of a --cities run; other cities' events are left out
+        
+    Returns:
+        list: Up to --max-events event dicts, best match first
+    """
+    max_age = args.query_max_age * 3600 if args.query_max_age > 0 else None
+    with METRICS.span("index.search"):
+        answers = index.search(args.query, limit=None if cities else args.max_events, max_age=max_age)
+    if cities:
+        answers = [(score, event) for score, event in answers if (event.get("city") or DEFAULT_CITY) in cities]
+    for score, event in answers[:3]:
+        logger.info(f"Index match {score:.2f}: {event.get('title')} ({event.get('url')})")
+    return [event for score, event in answers[:args.max_events]]
+
+def write_run_metrics(args, cities=None):
+    """
+    Log the phase timings and save the run metrics report.
+    
+    Args:
+        args: Parsed command-line arguments
+        cities: City slugs of a --cities run
+    """
+    METRICS.log_summary()
+    extra = {
+        "run": {
+            "keywords": args.keywords,
+            "cities": cities or [DEFAULT_CITY],
+            "fetch_mode": args.fetch_mode,
+            "extraction_mode": args.extraction_mode,
+            "workers": args.workers,
+            "output": args.output,
+        },
+        "rate_limiter": RATE_LIMITER.stats(),
+        "selector_plans": {plan.name: dict(plan.hits) for plan in SELECTOR_PLANS},
+    }
+    try:
+        METRICS.write_json(args.metrics_json, **extra)
+        if args.metrics_prometheus:
+            METRICS.write_prometheus(args.metrics_prometheus)
+    except OSError as e:
+        logger.error(f"Could not save run metrics: {str(e)}")
+
+def main():
+    """Main function to run the Luma SF events detailed scraper."""
+    # Parse command-line arguments
+    args = parse_arguments()
+    
+    # Turn SIGTERM (e.g. a cron timeout) into a normal exit so buffered output is flushed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(1))
+    
+    cities = split_keywords(args.cities.lower()) if args.cities else []
+    
+    # Set default output file if not specified
+    if not args.output:
+        keywords_slug = (args.keywords or "urls").lower().replace(",", "_").replace(" ", "_")
+        cities_slug = "_".join(cities) or DEFAULT_CITY
+        args.output = f"{cities_slug}_events_detailed_{keywords_slug}.{FILE_EXTENSIONS[args.format]}"
+    if not args.metrics_json:
+        args.metrics_json = os.path.splitext(args.output)[0] + ".metrics.json"
+    
+    pool = None
+    http_session = None
+    cache = None
+    dedupe = None
+    index = None
+    dropped = 0
+    
+    try:
+        set_base_url(args.base_url)
+        configure_rate_limiter(args)
+        if args.screenshots:
+            # City worker processes write into the same run directory
+            args.screenshot_run_dir = os.path.join(args.screenshot_dir, datetime.datetime.now().strftime("run_%Y%m%d_%H%M%S"))
+            if not cities:
+                configure_screenshots(args)
+            logger.info(f"Saving screenshots to {args.screenshot_run_dir}")
         
-        logger.info(f"Found {len(event_links)} event links")
+        # City worker processes open their own cache and HTTP session
+        if args.cache_ttl > 0 and not cities:
+            cache = EventCache(args.cache_path, ttl=args.cache_ttl * 3600, max_entries=args.cache_max_entries)
+            logger.info(f"Using event cache {args.cache_path} (TTL {args.cache_ttl} hours)")
         
-        # Extract details from each event
-        events = []
-        for i, link in enumerate(event_links, 1):
-            logger.info(f"Processing event {i}/{len(event_links)}: {link}")
-            event_details = extract_event_details(driver, link, args.wait_time, args.screenshots)
-            events.append(event_details)
+        # Browser sessions are started lazily, so HTTP-only runs never launch Chrome
+        pool = DriverPool(lambda: create_driver(args), size=args.workers)
+        if args.fetch_mode == 'http':
+            logger.info("Fetching event pages over HTTP with browser fallback")
+        if args.fetch_mode == 'http' and not cities:
+            http_session = create_http_session(pool_size=max(args.workers, 1))
+        if args.dedupe != 'off':
+            dedupe = NearDuplicateIndex(args.dedupe_path, threshold=args.dedupe_threshold)
+            logger.info(f"Detecting near-duplicate events with index {args.dedupe_path} ({args.dedupe} mode)")
+        if not args.no_index:
+            index = EventIndex(args.index_path)
+        
+        # Answer queries from the index; the browser is only started on a miss
+        if args.query and not args.refresh:
+            start = time.monotonic()
+            answers = answer_from_index(index, args, cities)
+            if answers:
+                with create_writer(args.format, args.output, mode=args.write_mode, keywords=args.query) as writer:
+                    for event in answers:
+                        writer.write(event)
+                METRICS.increment("index_answers")
+                elapsed_ms = (time.monotonic() - start) * 1000
+                logger.info(f"Answered '{args.query}' from the local index with {len(answers)} events in {elapsed_ms:.1f} ms")
+                print(f"\nAnswered from local index ({args.index_path}) in {elapsed_ms:.1f} ms")
+                print(f"Query: {args.query}")
+                print(f"Total events found: {len(answers)}")
+                print(f"Events saved to: {args.output}")
+                return 0
+            logger.info(f"No indexed events match '{args.query}'; searching Luma")
+        
+        keywords = split_keywords(args.keywords)
+        # Keywords matched by each event link, attached to the written records
+        keyword_matches = {}
+        
+        def discover_event_links():
+            """Yield event links, holding a browser session only while searching."""
+            if args.event_urls:
+                event_links = [url.strip() for url in args.event_urls.split(',') if url.strip()]
+                logger.info(f"Using {len(event_links)} event URLs from the command line")
+                yield from event_links
+                return
             
-            # Add a short delay between requests to avoid rate limiting
-            if i < len(event_links):
-                time.sleep(2)
-        
-        # Save events to file
-        with open(args.output, 'w') as f:
-            f.write(f"Luma SF Events Detailed Results\n")
-            f.write(f"Search keywords: {args.keywords}\n")
-            f.write(f"Generated on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            if len(keywords) > 1:
+                # One query per keyword, merged so that every event is fetched once
+                ranked = fan_out_search(pool, keywords, max_events=args.max_events, wait_time=args.wait_time,
+                                        take_screenshots=args.screenshots, extraction_mode=args.extraction_mode,
+                                        max_scrolls=args.max_scrolls)
+                for entry in ranked[:args.max_events]:
+                    keyword_matches[entry["url"]] = entry["keywords"]
+                    yield entry["url"]
+                return
             
-            for i, event in enumerate(events, 1):
-                f.write(f"Event {i}:\n")
-                f.write(f"Title: {event.get('title', 'Unknown')}\n")
+            driver = pool.acquire()
+            try:
+                # Search for events
+                if not search_for_events(driver, keywords[0], args.wait_time, args.screenshots):
+                    logger.error("Failed to search for events.")
+                    return
                 
-                # Write speakers
-                speakers = event.get('speakers', [])
-                if speakers:
-                    f.write("Speakers:\n")
-                    for speaker in speakers:
-                        f.write(f"  - {speaker.get('name', 'Unknown')}")
-                        if speaker.get('title_company'):
-                            f.write(f", {speaker.get('title_company')}")
-                        f.write("\n")
+                # Find event links
+                logger.info(f"Finding up to {args.max_events} event links")
+                for link in iter_event_links(driver, max_events=args.max_events, wait_time=args.wait_time,
+                                             take_screenshots=args.screenshots,
+                                             extraction_mode=args.extraction_mode,
+                                             max_scrolls=args.max_scrolls):
+                    keyword_matches[link] = keywords[:1]
+                    yield link
+            finally:
+                # Reuse the search session as an extraction worker
+                if is_driver_alive(driver):
+                    pool.release(driver)
                 else:
-                    f.write("Speakers: None listed\n")
-                
-                # Write summary
-                f.write(f"Summary: {event.get('summary', 'No summary available')}\n")
-                f.write(f"URL: {event.get('url', 'Unknown')}\n")
-                f.write("\n")
+                    pool.discard(driver)
+        
+        def extract(index, link):
+            logger.info(f"Processing event {index}: {link}")
+            event = extract_event_with_pool(pool, link, args.wait_time, args.screenshots,
+                                            http_session=http_session, extraction_mode=args.extraction_mode,
+                                            cache=cache, refresh=args.refresh)
+            if link in keyword_matches:
+                # Copy, so that cached records stay independent of the query
+                event = dict(event, matched_keywords=keyword_matches[link])
+            return event
+        
+        # Stream links from discovery to the detail workers and each finished
+        # event straight to the output file
+        if args.workers > 1:
+            logger.info(f"Extracting event details with {args.workers} parallel workers")
+        writer = create_writer(args.format, args.output, mode=args.write_mode, keywords=args.keywords)
+        
+        def write(event):
+            nonlocal dropped
+            if dedupe is not None:
+                with METRICS.span("dedupe.check"):
+                    match = dedupe.check(event)
+                if match:
+                    if match["duplicate_of"] and args.dedupe == 'drop':
+                        dropped += 1
+                        METRICS.increment("duplicates_dropped")
+                        return
+                    event = dict(event, cluster_id=match["cluster_id"])
+            with METRICS.span("output.write"):
+                writer.write(event)
+            METRICS.increment("events_written")
+            if index is not None:
+                with METRICS.span("index.add"):
+                    index.add(event)
+        
+        try:
+            if cities:
+                total = run_city_shards(args, cities, keywords, write, processes=args.processes)
+            else:
+                event_links = discover_event_links()
+                if args.dedupe == 'drop':
+                    # Links an earlier run clustered with another link of this run are not fetched again
+                    event_links = dedupe.filter_links(event_links)
+                total = run_pipeline(event_links, extract, write, workers=args.workers)
+        finally:
+            with METRICS.span("output.close"):
+                writer.close()
+        
+        if not total:
+            logger.error("No event links found. Exiting.")
+            return 1
         
         # Report results
+        RATE_LIMITER.log_stats()
+        log_selector_plans()
         logger.info("Event scraping completed successfully")
-        logger.info(f"Total events processed: {len(events)}")
+        logger.info(f"Total events processed: {total}")
         logger.info(f"Events saved to: {args.output}")
         
         print(f"\nLuma SF Event Scraping Completed Successfully")
-        print(f"Search keywords: {args.keywords}")
-        print(f"Total events processed: {len(events)}")
+        print(f"Search keywords: {args.keywords or 'N/A'}")
+        if cities:
+            print(f"Cities: {', '.join(cities)}")
+        print(f"Total events processed: {total}")
+        if dropped:
+            print(f"Near-duplicates dropped: {dropped}")
         print(f"Events saved to: {args.output}")
         
         return 0
@@ -514,9 +2016,19 @@ def main():
         return 1
     finally:
         # Clean up
-        if driver:
+        if cache:
+            cache.close()
+        if http_session:
+            http_session.close()
+        if dedupe:
+            dedupe.close()
+        if index:
+            index.close()
+        if pool:
             logger.info("Closing WebDriver")
-            driver.quit()
+            pool.close()
+        SCREENSHOTS.close()
+        write_run_metrics(args, cities)
 
 if __name__ == "__main__":
     sys.exit(main())
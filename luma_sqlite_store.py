@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Shared base of the SQLite-backed stores of the Luma scrapers.
+
+The event cache, the near-duplicate index and the full-text event index all
+keep one database file open for the whole run. This module holds the common
+part: opening the connection, creating the schema, the lock around the
+connection and closing it.
+
+Usage:
+    class EventCache(SqliteStore):
+        SCHEMA = "CREATE TABLE IF NOT EXISTS events (...);"
+
+        def get(self, url):
+            with self._lock:
+                return self._conn.execute("SELECT ...", (url,)).fetchone()
+"""
+
+import sqlite3
+import threading
+
+class SqliteStore:
+    """
+    SQLite database with a schema, used from several worker threads.
+
+    A single connection is shared between worker threads and guarded by
+    ``_lock``; subclasses hold the lock around every use of ``_conn``.
+    """
+
+    # CREATE statements run on every open; they must be idempotent
+    SCHEMA = ""
+
+    def __init__(self, path):
+        """
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(self.SCHEMA)
+        self._prepare()
+        self._conn.commit()
+
+    def _prepare(self):
+        """Hook run once after the schema is created, before the first commit."""
+
+    def _log_stats(self):
+        """Hook logging the store's statistics when it is closed."""
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+        self._log_stats()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Structured-data extractor for Luma event pages.
+
+Event pages embed machine-readable payloads next to the rendered markup:
+JSON-LD ``Event`` blocks and the Next.js ``__NEXT_DATA__`` script. Parsing
+those from the page source gives the title, hosts, summary and start time in
+one string parse, without any element queries.
+
+Usage:
+    from luma_structured_data import parse_structured_event
+    event = parse_structured_event(html, "https://lu.ma/e/evt-...")
+"""
+
+import re
+import json
+import logging
+from html import unescape
+
+logger = logging.getLogger(__name__)
+
+JSON_LD_PATTERN = re.compile(
+    r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL)
+
+NEXT_DATA_PATTERN = re.compile(
+    r'<script[^>]+id=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>',
+    re.IGNORECASE | re.DOTALL)
+
+EVENT_TYPES = {"Event", "BusinessEvent", "EducationEvent", "SocialEvent", "Hackathon"}
+
+# Summaries longer than this are truncated with an ellipsis
+MAX_SUMMARY_LENGTH = 500
+
+# Default field values meaning "not found"
+PLACEHOLDER_VALUES = ("Unknown Title", "No summary available")
+
+# Title of the placeholder records written when extraction fails
+ERROR_TITLE = "Error extracting details"
+
+def load_json_payloads(html):
+    """
+    Extract and decode the embedded JSON payloads of a page.
+
+    Args:
+        html: Page source
+
+    Returns:
+        tuple: (list of JSON-LD documents, Next.js data dict or None)
+    """
+    json_ld = []
+    for match in JSON_LD_PATTERN.finditer(html):
+        try:
+            json_ld.append(json.loads(match.group(1).strip()))
+        except ValueError as e:
+            logger.debug(f"Skipping invalid JSON-LD block: {str(e)}")
+
+    next_data = None
+    match = NEXT_DATA_PATTERN.search(html)
+    if match:
+        try:
+            next_data = json.loads(match.group(1).strip())
+        except ValueError as e:
+            logger.debug(f"Skipping invalid __NEXT_DATA__ payload: {str(e)}")
+
+    return json_ld, next_data
+
+def _walk(data):
+    """Yield every dict nested anywhere inside a JSON value."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            yield value
+            stack.extend(reversed(list(value.values())))
+        elif isinstance(value, list):
+            stack.extend(reversed(value))
+
+def _as_list(value):
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+def _clean_text(text):
+    return " ".join(unescape(str(text)).split())
+
+def _truncate(summary):
+    if len(summary) > MAX_SUMMARY_LENGTH:
+        summary = summary[:MAX_SUMMARY_LENGTH - 3] + "..."
+    return summary
+
+def _person_to_speaker(person):
+    """Convert a schema.org Person/Organization (or plain name) to a speaker dict."""
+    if isinstance(person, str):
+        return {"name": _clean_text(person), "title_company": ""}
+    if not isinstance(person, dict) or not person.get("name"):
+        return None
+
+    details = []
+    if person.get("jobTitle"):
+        details.append(_clean_text(person["jobTitle"]))
+    works_for = person.get("worksFor") or person.get("affiliation")
+    for organization in _as_list(works_for):
+        name = organization.get("name") if isinstance(organization, dict) else organization
+        if name:
+            details.append(_clean_text(name))
+
+    return {"name": _clean_text(person["name"]), "title_company": ", ".join(details)}
+
+def _unique_speakers(speakers):
+    unique = []
+    seen = set()
+    for speaker in speakers:
+        if speaker and speaker["name"].lower() not in seen:
+            seen.add(speaker["name"].lower())
+            unique.append(speaker)
+    return unique
+
+def event_from_json_ld(documents):
+    """
+    Build event fields from JSON-LD documents.
+
+    Args:
+        documents: Decoded JSON-LD documents
+
+    Returns:
+        dict: Partial event fields, or None if no Event object is present
+    """
+    for node in (node for document in documents for node in _walk(document)):
+        types = set(_as_list(node.get("@type")))
+        if not types & EVENT_TYPES or not node.get("name"):
+            continue
+
+        speakers = [_person_to_speaker(person)
+                    for key in ("performer", "organizer")
+                    for person in _as_list(node.get(key))]
+
+        return {
+            "title": _clean_text(node["name"]),
+            "speakers": _unique_speakers(speakers),
+            "summary": _clean_text(node.get("description") or ""),
+            "start_time": node.get("startDate"),
+        }
+    return None
+
+def _prosemirror_text(node):
+    """Flatten a ProseMirror document (Luma's rich-text description) to plain text."""
+    parts = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            if current.get("type") == "text" and current.get("text"):
+                parts.append(current["text"])
+            stack.extend(reversed(current.get("content") or []))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+    return _clean_text(" ".join(parts))
+
+def event_from_next_data(next_data):
+    """
+    Build event fields from the Next.js page data.
+
+    Args:
+        next_data: Decoded ``__NEXT_DATA__`` payload
+
+    Returns:
+        dict: Partial event fields, or None if no event object is present
+    """
+    event = None
+    hosts = []
+    description = ""
+    for node in _walk(next_data):
+        if event is None and node.get("name") and (node.get("start_at") or node.get("startDate")):
+            event = node
+        if not hosts and isinstance(node.get("hosts"), list):
+            hosts = node["hosts"]
+        if not description and node.get("description_mirror"):
+            description = _prosemirror_text(node["description_mirror"])
+
+    if event is None:
+        return None
+
+    speakers = []
+    for host in hosts:
+        if not isinstance(host, dict) or not host.get("name"):
+            continue
+        speakers.append({
+            "name": _clean_text(host["name"]),
+            "title_company": _clean_text(host.get("bio_short") or "")
+        })
+
+    return {
+        "title": _clean_text(event["name"]),
+        "speakers": _unique_speakers(speakers),
+        "summary": description or _clean_text(event.get("description") or ""),
+        "start_time": event.get("start_at") or event.get("startDate"),
+    }
+
+def parse_structured_event(html, event_url):
+    """
+    Parse an event record from the structured data embedded in a page.
+
+    JSON-LD is preferred; the Next.js payload fills in any field JSON-LD lacks.
+
+    Args:
+        html: Page source of the event page
+        event_url: URL of the event page
+
+    Returns:
+        dict: Event details including title, speakers, summary, start time and
+              link, or None if the page carries no structured event data
+    """
+    json_ld, next_data = load_json_payloads(html)
+    candidates = [event_from_json_ld(json_ld)]
+    if next_data is not None:
+        candidates.append(event_from_next_data(next_data))
+    candidates = [candidate for candidate in candidates if candidate]
+    if not candidates:
+        return None
+
+    merged = {}
+    for candidate in candidates:
+        for key, value in candidate.items():
+            if value and not merged.get(key):
+                merged[key] = value
+
+    return {
+        "title": merged.get("title") or "Unknown Title",
+        "speakers": merged.get("speakers") or [],
+        "summary": _truncate(merged.get("summary") or "No summary available"),
+        "start_time": merged.get("start_time"),
+        "url": event_url
+    }